@@ -0,0 +1,76 @@
+"""Shared fixtures for agent tests.
+
+Agent files are read and parsed once per session; per-agent fixtures
+index into the shared parsers instead of re-reading their markdown.
+"""
+
+import pytest
+import re
+from typing import Dict, FrozenSet, List
+
+from tests.agents.fixtures import AGENT_PATHS, AgentParser
+
+# Markers carried by tests under performance/; keep in sync with pytest.ini
+PERFORMANCE_MARKERS = frozenset({"performance"})
+
+MARKEXPR_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Filled in by pytest_configure when -m cannot select the performance tests
+collect_ignore_glob: List[str] = []
+
+
+# ============================================================================
+# Collection
+# ============================================================================
+
+
+def markexpr_may_select(markexpr: str, markers: FrozenSet[str]) -> bool:
+    """Tell whether a -m expression could select tests carrying ``markers``.
+
+    Conservative: an expression without ``not`` only combines marker names
+    with ``and``/``or``, so it cannot match a test unless it names one of
+    the test's markers. Any ``not`` is assumed to possibly match.
+
+    Args:
+        markexpr: Value of the -m option
+        markers: Every marker the tests in question may carry
+
+    Returns:
+        False only when no test carrying just ``markers`` can match
+    """
+    if not markexpr:
+        return True
+    tokens = set(MARKEXPR_TOKEN_PATTERN.findall(markexpr))
+    return "not" in tokens or not tokens.isdisjoint(markers)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Skip collecting performance tests when -m cannot select them.
+
+    Their modules scan the whole test tree, so importing them for a run like
+    ``-m unit`` only to deselect every item is wasted work.
+    """
+    ignore = not markexpr_may_select(config.getoption("markexpr"), PERFORMANCE_MARKERS)
+    collect_ignore_glob[:] = ["performance"] if ignore else []
+
+
+# ============================================================================
+# Agent Parsers
+# ============================================================================
+
+
+@pytest.fixture(scope="session")
+def all_agent_parsers() -> Dict[str, AgentParser]:
+    """Parse every agent file once per session.
+
+    Returns:
+        Dict mapping agent name to its parser
+    """
+    parsers = (AgentParser(path) for path in AGENT_PATHS)
+    return {parser.name: parser for parser in parsers}
+
+
+@pytest.fixture(scope="session")
+def all_agents(all_agent_parsers: Dict[str, AgentParser]) -> List[AgentParser]:
+    """All agent parsers, in file order, shared across the session."""
+    return list(all_agent_parsers.values())
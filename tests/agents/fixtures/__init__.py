@@ -6,7 +6,14 @@ This package provides:
 - Agent behavior simulation helpers
 """
 
-from .agent_parser import AgentParser, get_all_agent_paths
+from .agent_parser import (
+    AGENT_PATHS,
+    AgentMetadata,
+    AgentParser,
+    SectionBlock,
+    find_keywords,
+    get_all_agent_paths,
+)
 from .mock_helpers import (
     MockFileSystem,
     MockGitRepo,
@@ -17,7 +24,11 @@ from .mock_helpers import (
 )
 
 __all__ = [
+    "AGENT_PATHS",
+    "AgentMetadata",
     "AgentParser",
+    "SectionBlock",
+    "find_keywords",
     "get_all_agent_paths",
     "MockFileSystem",
     "MockGitRepo",
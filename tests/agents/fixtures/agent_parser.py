@@ -3,11 +3,77 @@
 Provides utilities to parse and validate agent markdown files.
 """
 
+from dataclasses import dataclass, fields
+from functools import cached_property, wraps
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, FrozenSet, List, Any, Optional, Tuple, TypeVar
+import os
 import re
+import sys
 import yaml
 
+# libyaml's C loader is several times faster; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
+T = TypeVar("T")
+
+SUBAGENTS_DIR = Path(__file__).parent.parent.parent.parent / ".claude" / "subagents"
+
+
+def _list_agent_paths() -> Tuple[Path, ...]:
+    """List agent markdown files with a single os.scandir call.
+
+    os.scandir returns names and entry types without a stat per file.
+
+    Returns:
+        Sorted paths of visible .md files, empty if the directory does not exist
+    """
+    try:
+        with os.scandir(SUBAGENTS_DIR) as entries:
+            return tuple(
+                sorted(
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".md")
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                )
+            )
+    except FileNotFoundError:
+        return ()
+
+
+# Listed once at import so every parametrized fixture shares one directory scan
+AGENT_PATHS: Tuple[Path, ...] = _list_agent_paths()
+
+WORD_PATTERN = re.compile(r"[a-z]+")
+# Identifier-like words in lowercased content ("flake8", "snake_case")
+CONTENT_TOKEN_PATTERN = re.compile(r"[a-z][a-z0-9_]*")
+# Identifier-like words in a section, case preserved ("HIGH", "Extract")
+SECTION_TOKEN_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+# Front matter must open the file; the lazy body stops at the first closing --- line
+FRONT_MATTER_PATTERN = re.compile(r"\A---[ \t]*\r?\n(.*?)^---[ \t]*\r?$", re.DOTALL | re.MULTILINE)
+CHECKBOX_PATTERN = re.compile(r"^\s*-\s*\[\s*[xX ]?\s*\]\s*(.+)$")
+ANTIPATTERN_PATTERN = re.compile(r"^\s*[❌✗]\s*(.+)$")
+STEP_PATTERN = re.compile(r"^\s*(\d+)\.\s*\*?\*?(.+?)\*?\*?\s*-\s*(.+)$")
+SIMPLE_STEP_PATTERN = re.compile(r"^\s*(\d+)\.\s*(.+)$")
+# "Rule #8" / "Rule 8" references, matched against lowercased content
+RULE_REFERENCE_PATTERN = re.compile(r"rule #?(\d+)")
+# Flat ``key: value`` front matter lines; anything else goes through PyYAML
+FLAT_KV_PATTERN = re.compile(r"([A-Za-z_]\w*): +(\S.*?) *")
+# Plain scalars safe to take verbatim: start with a letter, no mapping or comment
+# markers; str.isprintable() separately rules out tabs, control characters and
+# the characters YAML reads as line breaks
+FLAT_SCALAR_PATTERN = re.compile(r"[A-Za-z](?!.*(?:: |:$| #)).*")
+FLAT_LIST_PATTERN = re.compile(r"\[([\w ,-]*)\]")
+FLAT_LIST_ITEM_PATTERN = re.compile(r"[A-Za-z][\w-]*")
+# Words PyYAML resolves to booleans or null rather than strings
+YAML_SPECIAL_WORDS = frozenset({"yes", "no", "true", "false", "on", "off", "null"})
+
 
 def get_all_agent_paths() -> List[Path]:
     """Get paths to all agent markdown files.
@@ -19,8 +85,86 @@ def get_all_agent_paths() -> List[Path]:
     return sorted(agents_dir.glob("agent-*.md"))
 
 
+@dataclass(frozen=True, slots=True)
+class AgentMetadata:
+    """Standard agent front matter fields.
+
+    Values are kept as parsed (tools lists become tuples), so validation
+    tests can still report fields with the wrong type.
+    """
+
+    name: Optional[str] = None
+    description: Optional[str] = None
+    tools: Optional[Tuple[str, ...]] = None
+    model: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, metadata: Dict[str, Any]) -> "AgentMetadata":
+        """Build from a parsed front matter mapping, ignoring extra keys."""
+        tools = metadata.get("tools")
+        if isinstance(tools, list):
+            tools = tuple(tools)
+
+        return cls(
+            name=metadata.get("name"),
+            description=metadata.get("description"),
+            tools=tools,
+            model=metadata.get("model"),
+        )
+
+
+AGENT_METADATA_FIELDS: FrozenSet[str] = frozenset(field.name for field in fields(AgentMetadata))
+
+
+@dataclass(frozen=True, slots=True)
+class SectionBlock:
+    """A ``## `` section with the views tests read from it, built once."""
+
+    text: str
+    lower_text: str
+    checkboxes: Tuple[str, ...]
+
+
+def find_keywords(text: str, keywords: FrozenSet[str]) -> FrozenSet[str]:
+    """Find which of several keywords occur in a text.
+
+    Lets a test check a whole keyword set in one call and report every
+    missing keyword at once, instead of stopping at the first failed assert.
+
+    Args:
+        text: Text to search (lowercase it first for case-insensitive checks)
+        keywords: Keywords to look for
+
+    Returns:
+        The subset of keywords found in text
+    """
+    return frozenset(keyword for keyword in keywords if keyword in text)
+
+
+def _cached(method: Callable[..., T]) -> Callable[..., T]:
+    """Cache a parser method's result per instance and arguments.
+
+    Unlike functools.lru_cache, the cache lives on the instance, so it is
+    released together with the parser.
+    """
+
+    @wraps(method)
+    def wrapper(self: "AgentParser", *args: Any, **kwargs: Any) -> T:
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in self._cache:
+            self._cache[key] = method(self, *args, **kwargs)
+        return self._cache[key]
+
+    return wrapper
+
+
 class AgentParser:
-    """Parse and analyze agent markdown files."""
+    """Parse and analyze agent markdown files.
+
+    Parsers are read-only and may be shared between tests (e.g. via
+    session-scoped fixtures). Extraction results are cached per instance,
+    so callers must not mutate the returned lists.
+    """
 
     def __init__(self, agent_path: Path):
         """Initialize parser with agent file path.
@@ -30,56 +174,238 @@ class AgentParser:
         """
         self.path = agent_path
         self.name = agent_path.stem
-        self._content = self._load_content()
-        self._metadata, self._body = self._split_front_matter()
-        self._sections = self._parse_sections()
+        self._cache: Dict[tuple, Any] = {}
 
-    def _load_content(self) -> str:
-        """Load agent file content."""
-        with open(self.path, "r", encoding="utf-8") as f:
-            return f.read()
+    @cached_property
+    def _content(self) -> str:
+        """Load agent file content on first access.
 
-    def _split_front_matter(self) -> tuple[Dict[str, Any], str]:
+        Loading lazily lets a session build parsers for every agent while
+        only reading the files its selected tests use. Raw bytes are decoded
+        in one step, which skips the text layer's incremental decoding;
+        newlines are normalized as text mode would, but only when the file
+        actually contains a carriage return.
+        """
+        content = self.path.read_bytes().decode("utf-8")
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
+
+    @cached_property
+    def _front_matter(self) -> Optional[str]:
+        """Get the front matter text, or None if the file has none."""
+        return self._split_front_matter[0]
+
+    @cached_property
+    def _body(self) -> str:
+        """Get the markdown body without front matter."""
+        return self._split_front_matter[1]
+
+    @cached_property
+    def _split_front_matter(self) -> Tuple[Optional[str], str]:
         """Split YAML front matter from markdown body.
 
         Returns:
-            Tuple of (metadata dict, body string)
+            Tuple of (front matter text or None, body string)
         """
-        parts = self._content.split("---", 2)
+        # Cheap prefix check before running the regex
+        if not self._content.startswith("---"):
+            return None, self._content
+
+        match = FRONT_MATTER_PATTERN.match(self._content)
+        if not match:
+            return None, self._content
+
+        return match.group(1), self._content[match.end() :].strip()
 
-        if len(parts) < 3:
-            return {}, self._content
+    @staticmethod
+    def _parse_flat_front_matter(text: str) -> Optional[Dict[str, Any]]:
+        """Parse front matter made only of ``key: scalar`` and ``key: [a, b]`` lines.
+
+        Args:
+            text: Front matter text between the ``---`` fences
+
+        Returns:
+            Metadata dict, or None if the text is blank or any line needs
+            the full YAML parser
+        """
+        metadata: Dict[str, Any] = {}
+
+        for line in text.replace("\r\n", "\n").split("\n"):
+            # Tabs and other whitespace on blank lines are left to PyYAML
+            if not line.strip(" "):
+                continue
+
+            match = FLAT_KV_PATTERN.fullmatch(line)
+            if not match:
+                return None
+
+            key, value = match.groups()
+            if key.lower() in YAML_SPECIAL_WORDS:
+                return None
+
+            list_match = FLAT_LIST_PATTERN.fullmatch(value)
+
+            if list_match:
+                items = [item.strip() for item in list_match.group(1).split(",")]
+                if items == [""]:
+                    items = []
+                for item in items:
+                    if (
+                        not FLAT_LIST_ITEM_PATTERN.fullmatch(item)
+                        or item.lower() in YAML_SPECIAL_WORDS
+                    ):
+                        return None
+                metadata[key] = items
+            elif (
+                value.isprintable()
+                and FLAT_SCALAR_PATTERN.fullmatch(value)
+                and value.lower() not in YAML_SPECIAL_WORDS
+            ):
+                metadata[key] = value
+            else:
+                return None
+
+        return metadata or None
+
+    @cached_property
+    def _metadata(self) -> Dict[str, Any]:
+        """Parse YAML front matter on first access.
+
+        Returns:
+            Metadata dict, empty if front matter is missing, blank or invalid
+        """
+        if self._front_matter is None or not self._front_matter.strip():
+            return {}
+
+        metadata = self._parse_flat_front_matter(self._front_matter)
+        if metadata is not None:
+            return metadata
 
         try:
-            metadata = yaml.safe_load(parts[1])
+            metadata = yaml.load(self._front_matter, Loader=SafeLoader)
         except yaml.YAMLError:
             metadata = {}
 
-        return metadata or {}, parts[2].strip()
+        return metadata or {}
+
+    @cached_property
+    def _sections(self) -> Dict[str, str]:
+        """Index ``## `` sections by locating headings with str.find.
 
-    def _parse_sections(self) -> Dict[str, str]:
-        """Parse markdown sections from body.
+        Section lookups are the most common access, so they avoid the full
+        line tokenization in _body_scan.
 
         Returns:
             Dict mapping section titles to content
         """
+        body = self._body
+
+        # Offsets where each heading line starts
+        starts = [0] if body.startswith("## ") else []
+        pos = body.find("\n## ")
+        while pos != -1:
+            starts.append(pos + 1)
+            pos = body.find("\n## ", pos + 1)
+
         sections = {}
-        current_section = None
-        current_content = []
+        for index, start in enumerate(starts):
+            line_end = body.find("\n", start)
+            if line_end == -1:
+                line_end = len(body)
+
+            # An empty title ends the previous section without starting a new one
+            title = body[start + 3 : line_end].strip()
+            if not title:
+                continue
+
+            # A repeated title replaces the earlier section; interned titles
+            # let lookups with literal names hit on identity
+            end = starts[index + 1] if index + 1 < len(starts) else len(body)
+            sections[sys.intern(title)] = body[line_end + 1 : end].strip()
+
+        return sections
+
+    @cached_property
+    def _body_scan(self) -> Tuple[List[Tuple[Optional[str], str]], tuple]:
+        """Tokenize the body in a single pass over its lines.
+
+        Each line is classified once: ``## `` headings switch sections, code
+        fences toggle code blocks, and list items are dispatched on their
+        first non-blank character, so only candidate lines reach the item
+        patterns.
+
+        Returns:
+            Tuple of (code blocks, list items), see _code_blocks and _list_items
+        """
+        blocks: List[Tuple[Optional[str], str]] = []
+        in_block = False
+        block_lang = None
+        current_block: List[str] = []
+
+        checkboxes: List[str] = []
+        section_checkboxes: Dict[str, List[str]] = {}
+        antipatterns: List[str] = []
+        process_steps: List[str] = []
+        current_checkboxes: Optional[List[str]] = None
+        in_process = False
 
         for line in self._body.split("\n"):
             if line.startswith("## "):
-                if current_section:
-                    sections[current_section] = "\n".join(current_content).strip()
-                current_section = line[3:].strip()
-                current_content = []
-            elif current_section:
-                current_content.append(line)
+                # A repeated title replaces the earlier section
+                title = line[3:].strip()
+                current_checkboxes = section_checkboxes[title] = [] if title else None
+                in_process = title == "Process"
+                if in_process:
+                    process_steps = []
+
+                if in_block:
+                    current_block.append(line)
+                continue
 
-        if current_section:
-            sections[current_section] = "\n".join(current_content).strip()
+            stripped = line.strip()
+            first = stripped[:1]
 
-        return sections
+            if first == "`" and stripped.startswith("```"):
+                if in_block:
+                    # End of code block
+                    blocks.append((block_lang, "\n".join(current_block)))
+                    current_block = []
+                    in_block = False
+                    block_lang = None
+                else:
+                    # Start of code block
+                    in_block = True
+                    block_lang = stripped[3:].strip() or None
+                continue
+
+            if in_block:
+                current_block.append(line)
+
+            if first == "-":
+                match = CHECKBOX_PATTERN.match(line)
+                if match:
+                    checkbox = match.group(1).strip()
+                    checkboxes.append(checkbox)
+                    if current_checkboxes is not None:
+                        current_checkboxes.append(checkbox)
+            elif first in ("❌", "✗"):
+                match = ANTIPATTERN_PATTERN.match(line)
+                if match:
+                    antipatterns.append(match.group(1).strip())
+            elif in_process and first.isdigit():
+                # Try detailed pattern first, then simple pattern
+                match = STEP_PATTERN.match(line)
+                if match:
+                    process_steps.append(f"{match.group(2)}: {match.group(3)}")
+                    continue
+
+                match = SIMPLE_STEP_PATTERN.match(line)
+                if match:
+                    process_steps.append(match.group(2).strip())
+
+        list_items = (checkboxes, section_checkboxes, antipatterns, process_steps)
+        return blocks, list_items
 
     # ========================================================================
     # Metadata Access
@@ -90,13 +416,25 @@ class AgentParser:
         """Get agent metadata from YAML front matter."""
         return self._metadata
 
+    @cached_property
+    def meta(self) -> AgentMetadata:
+        """Get the standard metadata fields as an attribute-access record."""
+        return AgentMetadata.from_dict(self._metadata)
+
     @property
     def has_frontmatter(self) -> bool:
         """Check if agent has YAML front matter."""
-        return bool(self._metadata)
+        # Files without a front matter block never reach the YAML parser
+        return self._front_matter is not None and bool(self._metadata)
 
     def get_metadata_field(self, field: str) -> Optional[Any]:
-        """Get specific metadata field value."""
+        """Get specific metadata field value.
+
+        Standard fields are read from ``meta``; any other key falls back to
+        the raw front matter mapping.
+        """
+        if field in AGENT_METADATA_FIELDS:
+            return getattr(self.meta, field)
         return self._metadata.get(field)
 
     # ========================================================================
@@ -108,6 +446,26 @@ class AgentParser:
         """Get full file content (with front matter)."""
         return self._content
 
+    @cached_property
+    def content_lower(self) -> str:
+        """Get full file content lowercased, for case-insensitive checks."""
+        return self._content.lower()
+
+    @cached_property
+    def content_tokens(self) -> FrozenSet[str]:
+        """Get the set of lowercased identifier-like words in the file.
+
+        Use for whole-word keyword checks; phrases and punctuation such as
+        "file:line" still need a substring check on content_lower.
+        """
+        return frozenset(CONTENT_TOKEN_PATTERN.findall(self.content_lower))
+
+    @cached_property
+    def referenced_rules(self) -> FrozenSet[int]:
+        """Get the framework rule numbers referenced as "Rule #N" or "Rule N"."""
+        numbers = RULE_REFERENCE_PATTERN.findall(self.content_lower)
+        return frozenset(int(number) for number in numbers)
+
     @property
     def body(self) -> str:
         """Get markdown body (without front matter)."""
@@ -118,22 +476,92 @@ class AgentParser:
         """Get all parsed sections."""
         return self._sections
 
+    @cached_property
+    def section_blocks(self) -> Dict[str, SectionBlock]:
+        """Get every section with its lowercased text and checkboxes."""
+        section_checkboxes = self._list_items[1]
+        return {
+            title: SectionBlock(
+                text=content,
+                lower_text=content.lower(),
+                checkboxes=tuple(section_checkboxes.get(title, ())),
+            )
+            for title, content in self._sections.items()
+        }
+
+    @cached_property
+    def sections_lower(self) -> Dict[str, str]:
+        """Get all sections with lowercased content, keyed by original title."""
+        return {title: block.lower_text for title, block in self.section_blocks.items()}
+
     def get_section(self, title: str) -> Optional[str]:
         """Get specific section content by title."""
         return self._sections.get(title)
 
+    def get_section_block(self, title: str) -> Optional[SectionBlock]:
+        """Get specific section with its derived views by title."""
+        return self.section_blocks.get(title)
+
+    def get_section_lower(self, title: str) -> Optional[str]:
+        """Get specific section content lowercased, for case-insensitive checks."""
+        block = self.section_blocks.get(title)
+        return block.lower_text if block else None
+
+    @_cached
+    def get_section_tokens(self, title: str) -> FrozenSet[str]:
+        """Get the set of case-preserved words in a section.
+
+        Use for whole-word checks such as severity labels ("HIGH");
+        phrases still need a substring check on the section text.
+
+        Args:
+            title: Section title
+
+        Returns:
+            Words found in the section (empty if it is missing)
+        """
+        section = self.get_section(title)
+        return frozenset(SECTION_TOKEN_PATTERN.findall(section)) if section else frozenset()
+
     def get_section_content(self, title: str) -> Optional[str]:
         """Get specific section content by title (alias for get_section)."""
         return self.get_section(title)
 
+    @cached_property
+    def section_titles(self) -> FrozenSet[str]:
+        """Get the set of section titles, for set-based section checks."""
+        return frozenset(self._sections)
+
     def has_section(self, title: str) -> bool:
         """Check if section exists."""
         return title in self._sections
 
+    def has_any_section(self, titles: FrozenSet[str]) -> bool:
+        """Check if at least one of the given section titles exists."""
+        return not self.section_titles.isdisjoint(titles)
+
     # ========================================================================
     # Code Block Extraction
     # ========================================================================
 
+    @property
+    def _code_blocks(self) -> List[Tuple[Optional[str], str]]:
+        """Every code block as (language or None, content), in document order."""
+        return self._body_scan[0]
+
+    @cached_property
+    def _code_blocks_by_language(self) -> Dict[Optional[str], List[str]]:
+        """Code block contents indexed by language (None if unlabelled)."""
+        blocks: Dict[Optional[str], List[str]] = {}
+        for block_lang, block in self._code_blocks:
+            blocks.setdefault(block_lang, []).append(block)
+        return blocks
+
+    @cached_property
+    def _all_code_blocks(self) -> List[str]:
+        """All code block contents in document order."""
+        return [block for _, block in self._code_blocks]
+
     def extract_code_blocks(self, language: Optional[str] = None) -> List[str]:
         """Extract code blocks from agent content.
 
@@ -143,30 +571,35 @@ class AgentParser:
         Returns:
             List of code block contents
         """
-        blocks = []
-        in_block = False
-        block_lang = None
-        current_block = []
+        if language is None:
+            return self._all_code_blocks
+        return self._code_blocks_by_language.get(language, [])
 
-        for line in self._body.split("\n"):
-            stripped = line.strip()
+    @_cached
+    def get_code_text(self, language: Optional[str] = None) -> str:
+        """Get code blocks joined into one string for substring checks.
 
-            if stripped.startswith("```"):
-                if in_block:
-                    # End of code block
-                    if language is None or block_lang == language:
-                        blocks.append("\n".join(current_block))
-                    current_block = []
-                    in_block = False
-                    block_lang = None
-                else:
-                    # Start of code block
-                    in_block = True
-                    block_lang = stripped[3:].strip() or None
-            elif in_block:
-                current_block.append(line)
+        Args:
+            language: Optional language filter (e.g., 'python', 'bash')
 
-        return blocks
+        Returns:
+            Code block contents separated by newlines ("" if there are none)
+        """
+        return "\n".join(self.extract_code_blocks(language))
+
+    # ========================================================================
+    # List Item Extraction
+    # ========================================================================
+
+    @property
+    def _list_items(self) -> Tuple[List[str], Dict[str, List[str]], List[str], List[str]]:
+        """Checkboxes, anti-patterns and process steps found in the body.
+
+        Returns:
+            Tuple of (all checkboxes, checkboxes by section, anti-patterns,
+            process steps)
+        """
+        return self._body_scan[1]
 
     # ========================================================================
     # Checklist Extraction
@@ -178,15 +611,7 @@ class AgentParser:
         Returns:
             List of checkbox items (without checkbox markers)
         """
-        checkboxes = []
-        checkbox_pattern = r"^\s*-\s*\[\s*[xX ]?\s*\]\s*(.+)$"
-
-        for line in self._body.split("\n"):
-            match = re.match(checkbox_pattern, line)
-            if match:
-                checkboxes.append(match.group(1).strip())
-
-        return checkboxes
+        return self._list_items[0]
 
     def get_section_checkboxes(self, section_title: str) -> List[str]:
         """Extract checkboxes from specific section.
@@ -197,19 +622,42 @@ class AgentParser:
         Returns:
             List of checkbox items in that section
         """
-        section_content = self.get_section(section_title)
-        if not section_content:
-            return []
+        return self._list_items[1].get(section_title, [])
 
-        checkboxes = []
-        checkbox_pattern = r"^\s*-\s*\[\s*[xX ]?\s*\]\s*(.+)$"
+    def count_section_checkboxes(self, section_title: str) -> int:
+        """Count checkboxes in specific section.
 
-        for line in section_content.split("\n"):
-            match = re.match(checkbox_pattern, line)
-            if match:
-                checkboxes.append(match.group(1).strip())
+        Args:
+            section_title: Section title to search in
 
-        return checkboxes
+        Returns:
+            Number of checkbox items in that section
+        """
+        return len(self._list_items[1].get(section_title, ()))
+
+    @_cached
+    def get_section_checkboxes_lower(self, section_title: str) -> List[str]:
+        """Extract lowercased checkboxes from specific section.
+
+        Args:
+            section_title: Section title to search in
+
+        Returns:
+            List of lowercased checkbox items in that section
+        """
+        return [checkbox.lower() for checkbox in self.get_section_checkboxes(section_title)]
+
+    @_cached
+    def get_section_checkboxes_text(self, section_title: str) -> str:
+        """Get a section's checkboxes joined into one lowercased string.
+
+        Args:
+            section_title: Section title to search in
+
+        Returns:
+            Lowercased checkbox items separated by spaces
+        """
+        return " ".join(self.get_section_checkboxes_lower(section_title))
 
     # ========================================================================
     # Anti-Pattern Extraction
@@ -221,15 +669,21 @@ class AgentParser:
         Returns:
             List of anti-pattern descriptions (without ❌ markers)
         """
-        antipatterns = []
-        antipattern_pattern = r"^\s*[❌✗]\s*(.+)$"
+        return self._list_items[2]
 
-        for line in self._body.split("\n"):
-            match = re.match(antipattern_pattern, line)
-            if match:
-                antipatterns.append(match.group(1).strip())
+    @cached_property
+    def antipatterns_text(self) -> str:
+        """Get all anti-patterns joined into one lowercased string."""
+        return " ".join(self.extract_antipatterns()).lower()
+
+    @cached_property
+    def antipatterns_tokens(self) -> FrozenSet[str]:
+        """Get the set of lowercased words used in anti-patterns.
 
-        return antipatterns
+        Use for whole-word checks; stems and phrases ("alternative" vs
+        "alternatives") need a substring check on antipatterns_text.
+        """
+        return frozenset(WORD_PATTERN.findall(self.antipatterns_text))
 
     # ========================================================================
     # Process Step Extraction
@@ -241,27 +695,21 @@ class AgentParser:
         Returns:
             List of process step descriptions
         """
-        process_section = self.get_section("Process")
-        if not process_section:
-            return []
-
-        steps = []
-        step_pattern = r"^\s*(\d+)\.\s*\*?\*?(.+?)\*?\*?\s*-\s*(.+)$"
-        simple_pattern = r"^\s*(\d+)\.\s*(.+)$"
-
-        for line in process_section.split("\n"):
-            # Try detailed pattern first
-            match = re.match(step_pattern, line)
-            if match:
-                steps.append(f"{match.group(2)}: {match.group(3)}")
-                continue
+        return self._list_items[3]
+
+    def count_process_steps(self) -> int:
+        """Count numbered process steps in Process section."""
+        return len(self._list_items[3])
 
-            # Try simple pattern
-            match = re.match(simple_pattern, line)
-            if match:
-                steps.append(match.group(2).strip())
+    @cached_property
+    def process_steps_lower(self) -> List[str]:
+        """Get lowercased process steps for case-insensitive checks."""
+        return [step.lower() for step in self.extract_process_steps()]
 
-        return steps
+    @cached_property
+    def process_steps_text(self) -> str:
+        """Get all process steps joined into one lowercased string."""
+        return " ".join(self.process_steps_lower)
 
     # ========================================================================
     # Validation Helpers
@@ -307,7 +755,7 @@ class AgentParser:
             "code_blocks": len(self.extract_code_blocks()),
             "checkboxes": len(self.extract_checkboxes()),
             "antipatterns": len(self.extract_antipatterns()),
-            "process_steps": len(self.extract_process_steps()),
+            "process_steps": self.count_process_steps(),
             "lines": len(self._content.split("\n")),
             "characters": len(self._content),
         }
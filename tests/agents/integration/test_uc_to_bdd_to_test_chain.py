@@ -19,12 +19,16 @@ Test Coverage:
 """
 
 import pytest
+import re
 from pathlib import Path
 from typing import Dict, Any
 
 from tests.agents.fixtures import MockFileSystem
 
 
+SCENARIO_TITLE_PATTERN = re.compile(r"Scenario: ([^\n]+)")
+
+
 # ============================================================================
 # Fixtures
 # ============================================================================
@@ -517,9 +521,7 @@ def test_all_uc_scenarios_have_feature_scenarios(sample_uc_with_bdd: str, mock_f
     uc_content = mock_fs.read_file(sample_uc_with_bdd)
 
     # Extract UC scenarios
-    import re
-
-    uc_scenarios = re.findall(r"Scenario: ([^\n]+)", uc_content)
+    uc_scenarios = SCENARIO_TITLE_PATTERN.findall(uc_content)
 
     # Simulate feature with same scenarios
     feature_scenarios_text = "\n".join(f"  Scenario: {s}" for s in uc_scenarios)
@@ -17,12 +17,71 @@ Test Coverage:
 - Framework rules tested
 """
 
+import ast
+import os
+import pickle
 import pytest
+import re
+import warnings
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
 from tests.agents.fixtures import get_all_agent_paths
 
+# ============================================================================
+# Constants
+# ============================================================================
+
+TEST_ROOT = Path(__file__).parent.parent
+UNIT_DIR = TEST_ROOT / "unit"
+INTEGRATION_DIR = TEST_ROOT / "integration"
+E2E_DIR = TEST_ROOT / "e2e"
+FIXTURES_DIR = TEST_ROOT / "fixtures"
+
+# Lowercase keywords the critical-functionality tests look for in test files
+COVERAGE_KEYWORDS = (
+    "tdd",
+    "red",
+    "green",
+    "refactor",
+    "traceability",
+    "uc-",
+    "adr",
+    "compliance",
+    "quality",
+    "score",
+    "type hint",
+    "spec",
+    "first",
+    "specification",
+)
+
+# One presence bit per keyword, so compound checks are a single AND per file
+COVERAGE_KEYWORD_BITS = {kw: 1 << bit for bit, kw in enumerate(COVERAGE_KEYWORDS)}
+
+# Zero-width lookahead reports overlapping matches; longest keywords first so a
+# keyword that prefixes another (spec/specification) is shadowed, not lost
+_COVERAGE_KEYWORD_RE = re.compile(
+    b"(?=("
+    + b"|".join(re.escape(kw.encode()) for kw in sorted(COVERAGE_KEYWORDS, key=len, reverse=True))
+    + b"))"
+)
+
+# Test type markers counted by the distribution and size checks
+TEST_TYPE_MARKERS = ("unit", "integration", "e2e", "performance")
+
+_MARKER_RE = re.compile(rb"@pytest\.mark\.(\w+)")
+
+# A test function's "def" and name are separated by whitespace only
+_TEST_DEF_RE = re.compile(rb"\bdef\s+test_")
+
+# "Rule #7" / "Rule 7" references to the 12 Non-Negotiable Rules
+_RULE_REFERENCE_RE = re.compile(rb"Rule #?(1[0-2]|[1-9])\b")
+
+# Keywords are ASCII, so lowercasing raw bytes avoids decoding every file
+_ASCII_LOWER = bytes.maketrans(bytes(range(0x41, 0x5B)), bytes(range(0x61, 0x7B)))
+
 
 # ============================================================================
 # Helper Functions
@@ -31,8 +90,7 @@ from tests.agents.fixtures import get_all_agent_paths
 
 def get_all_test_files() -> List[Path]:
     """Get all test files in the test suite."""
-    test_root = Path(__file__).parent.parent
-    return list(test_root.glob("**/*test_*.py"))
+    return list(TEST_ROOT.glob("**/*test_*.py"))
 
 
 def get_tested_agents() -> Set[str]:
@@ -52,19 +110,194 @@ def get_tested_agents() -> Set[str]:
     return tested
 
 
-def count_tests_by_marker(marker: str) -> int:
-    """Count tests with specific marker (unit, integration, e2e, performance)."""
-    # Note: This would require pytest collection
-    # For now, we'll analyze test files directly
-    test_files = get_all_test_files()
-    count = 0
+def find_coverage_keywords(content: bytes) -> Set[str]:
+    """Find all COVERAGE_KEYWORDS in lowercased content with a single regex pass.
+
+    Args:
+        content: Lowercased file content
+
+    Returns:
+        Set of keywords present in content
+    """
+    matched = {match.decode() for match in _COVERAGE_KEYWORD_RE.findall(content)}
+
+    # Add keywords shadowed by a longer match at the same position
+    return {kw for kw in COVERAGE_KEYWORDS if any(kw in match for match in matched)}
+
+
+def keyword_mask(*keywords: str) -> int:
+    """Combine COVERAGE_KEYWORDS into a presence bitmask.
+
+    Args:
+        *keywords: Keywords from COVERAGE_KEYWORDS
+
+    Returns:
+        Bitmask with one bit set per keyword
+    """
+    mask = 0
+    for keyword in keywords:
+        mask |= COVERAGE_KEYWORD_BITS[keyword]
+    return mask
+
+
+def list_dir_names(directory: Path) -> Set[str]:
+    """List entry names in a directory with a single scandir call.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Set of entry names, empty if the directory does not exist
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+
+def count_all_markers(sources: List[Tuple[Path, bytes]]) -> Counter:
+    """Count @pytest.mark.<marker> decorators for every marker in one pass.
+
+    Args:
+        sources: (path, raw source bytes) tuples, as from all_test_sources
+
+    Returns:
+        Counter mapping marker name to number of occurrences
+    """
+    counts: Counter = Counter()
+
+    for _, source in sources:
+        counts.update(marker.decode() for marker in _MARKER_RE.findall(source))
+
+    return counts
+
+
+def is_fresh_corpus_entry(entry: object, stat: os.stat_result) -> bool:
+    """Check that a cached corpus entry is well formed and matches the file on disk.
+
+    Args:
+        entry: Value loaded from the corpus cache for one test file
+        stat: Current stat of that test file
+
+    Returns:
+        True if entry is a (size, mtime_ns, source, lowered) tuple for this stat
+    """
+    return (
+        isinstance(entry, tuple)
+        and len(entry) == 4
+        and entry[:2] == (stat.st_size, stat.st_mtime_ns)
+        and isinstance(entry[2], bytes)
+        and isinstance(entry[3], bytes)
+    )
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture(scope="session")
+def suite_corpus(request) -> List[Tuple[Path, bytes, bytes]]:
+    """Read and lowercase every test file once per session.
+
+    Entries are persisted in the pytest cache with each file's size and
+    mtime, so unchanged files are neither re-read nor re-lowered on later
+    runs or by pytest-xdist workers.
+
+    Returns:
+        List of (path, raw source bytes, lowercased source bytes) tuples
+    """
+    test_files = sorted(get_all_test_files())
+    cache = getattr(request.config, "cache", None)
+    corpus_file = cache.mkdir("coverage-corpus") / "corpus.pickle" if cache else None
+    cached: Dict[str, tuple] = {}
+
+    if corpus_file is not None:
+        try:
+            loaded = pickle.loads(corpus_file.read_bytes())
+        except Exception:
+            # Missing, truncated or written by an incompatible version: rebuild
+            loaded = None
+        if isinstance(loaded, dict):
+            cached = loaded
+
+    entries: Dict[str, tuple] = {}
+    changed = len(cached) != len(test_files)
 
     for test_file in test_files:
-        content = test_file.read_text()
-        # Count occurrences of @pytest.mark.<marker>
-        count += content.count(f"@pytest.mark.{marker}")
+        stat = test_file.stat()
+        entry = cached.get(str(test_file))
+
+        if not is_fresh_corpus_entry(entry, stat):
+            source = test_file.read_bytes()
+            entry = (stat.st_size, stat.st_mtime_ns, source, source.translate(_ASCII_LOWER))
+            changed = True
+
+        entries[str(test_file)] = entry
+
+    if corpus_file is not None and changed:
+        # Write atomically so concurrent xdist workers never read a partial file
+        tmp_file = corpus_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_bytes(pickle.dumps(entries))
+        os.replace(tmp_file, corpus_file)
+
+        # Drop corpora from older layouts (one <hash>.pickle per suite state)
+        for stale_file in corpus_file.parent.glob("*.pickle"):
+            if stale_file != corpus_file:
+                stale_file.unlink(missing_ok=True)
+
+    return [(test_file, *entries[str(test_file)][2:]) for test_file in test_files]
+
+
+@pytest.fixture(scope="session")
+def all_test_sources(suite_corpus: List[Tuple[Path, bytes, bytes]]) -> List[Tuple[Path, bytes]]:
+    """Raw source of every test file.
+
+    Returns:
+        List of (path, raw source bytes) tuples
+    """
+    return [(path, source) for path, source, _ in suite_corpus]
+
+
+@pytest.fixture(scope="session")
+def all_test_contents(suite_corpus: List[Tuple[Path, bytes, bytes]]) -> List[Tuple[Path, bytes]]:
+    """ASCII-lowercased test file contents for case-insensitive keyword scans.
+
+    Returns:
+        List of (path, lowercased source bytes) tuples
+    """
+    return [(path, content) for path, _, content in suite_corpus]
+
+
+@pytest.fixture(scope="session")
+def marker_counts(all_test_sources: List[Tuple[Path, bytes]]) -> Counter:
+    """Marker decorator counts across the test suite.
+
+    Returns:
+        Counter mapping marker name to number of occurrences
+    """
+    return count_all_markers(all_test_sources)
+
+
+@pytest.fixture(scope="session")
+def all_test_trees(all_test_sources: List[Tuple[Path, bytes]]) -> List[ast.Module]:
+    """Parsed syntax tree of each test file.
+
+    Returns:
+        One ast.Module per test file
+    """
+    return [ast.parse(source, filename=str(path)) for path, source in all_test_sources]
 
-    return count
+
+@pytest.fixture(scope="session")
+def all_test_keyword_masks(all_test_contents: List[Tuple[Path, bytes]]) -> List[int]:
+    """Coverage keywords found in each test file, as presence bitmasks.
+
+    Returns:
+        One keyword_mask() per test file
+    """
+    return [keyword_mask(*find_coverage_keywords(content)) for _, content in all_test_contents]
 
 
 # ============================================================================
@@ -116,16 +349,14 @@ def test_tier1_agents_have_comprehensive_tests():
     }
 
     # Each Tier 1 agent should have unit tests
-    test_dir = Path(__file__).parent.parent / "unit"
-
     for agent in tier1_agents:
-        test_file = test_dir / f"test_{agent.replace('-', '_')}_agent.py"
+        test_file = UNIT_DIR / f"test_{agent.replace('-', '_')}_agent.py"
 
         assert test_file.exists(), f"Tier 1 agent {agent} missing unit tests at {test_file}"
 
         # Test file should be substantial (> 100 lines)
-        content = test_file.read_text()
-        lines = len(content.split("\n"))
+        # Same as len(content.split("\n")), without decoding or building a list
+        lines = test_file.read_bytes().count(b"\n") + 1
 
         assert lines > 100, f"Tier 1 agent {agent} has minimal tests ({lines} lines)"
 
@@ -164,14 +395,13 @@ def test_all_tiers_represented_in_tests():
 
 
 @pytest.mark.performance
-def test_balanced_test_type_distribution():
+def test_balanced_test_type_distribution(marker_counts: Counter):
     """Test that test suite has balanced distribution of test types."""
-    unit_count = count_tests_by_marker("unit")
-    integration_count = count_tests_by_marker("integration")
-    e2e_count = count_tests_by_marker("e2e")
-    performance_count = count_tests_by_marker("performance")
+    unit_count = marker_counts["unit"]
+    integration_count = marker_counts["integration"]
+    e2e_count = marker_counts["e2e"]
 
-    total = unit_count + integration_count + e2e_count + performance_count
+    total = sum(marker_counts[marker] for marker in TEST_TYPE_MARKERS)
 
     # Unit tests should be majority (50-70%)
     unit_percentage = (unit_count / total * 100) if total > 0 else 0
@@ -192,27 +422,27 @@ def test_balanced_test_type_distribution():
 
 
 @pytest.mark.performance
-def test_sufficient_unit_tests():
+def test_sufficient_unit_tests(marker_counts: Counter):
     """Test that suite has sufficient unit tests."""
-    unit_count = count_tests_by_marker("unit")
+    unit_count = marker_counts["unit"]
 
     # Should have at least 200 unit tests (comprehensive coverage)
     assert unit_count >= 150, f"Only {unit_count} unit tests (expected ≥ 150 for 18 agents)"
 
 
 @pytest.mark.performance
-def test_sufficient_integration_tests():
+def test_sufficient_integration_tests(marker_counts: Counter):
     """Test that suite has sufficient integration tests."""
-    integration_count = count_tests_by_marker("integration")
+    integration_count = marker_counts["integration"]
 
     # Should have at least 30 integration tests (key workflows)
     assert integration_count >= 20, f"Only {integration_count} integration tests (expected ≥ 20)"
 
 
 @pytest.mark.performance
-def test_sufficient_e2e_tests():
+def test_sufficient_e2e_tests(marker_counts: Counter):
     """Test that suite has sufficient e2e tests."""
-    e2e_count = count_tests_by_marker("e2e")
+    e2e_count = marker_counts["e2e"]
 
     # Should have at least 20 e2e tests (complete workflows)
     assert e2e_count >= 15, f"Only {e2e_count} e2e tests (expected ≥ 15)"
@@ -224,70 +454,42 @@ def test_sufficient_e2e_tests():
 
 
 @pytest.mark.performance
-def test_tdd_workflow_tested():
+def test_tdd_workflow_tested(all_test_keyword_masks: List[int]):
     """Test that TDD workflow (RED → GREEN → REFACTOR) is tested."""
     # Check for TDD cycle tests
-    test_files = get_all_test_files()
-
-    tdd_tested = False
-
-    for test_file in test_files:
-        content = test_file.read_text().lower()
-
-        if "tdd" in content or ("red" in content and "green" in content):
-            tdd_tested = True
-            break
+    tdd = keyword_mask("tdd")
+    red_green = keyword_mask("red", "green")
+    tdd_tested = any(mask & tdd or mask & red_green == red_green for mask in all_test_keyword_masks)
 
     assert tdd_tested, "TDD workflow not tested"
 
 
 @pytest.mark.performance
-def test_traceability_workflow_tested():
+def test_traceability_workflow_tested(all_test_keyword_masks: List[int]):
     """Test that traceability (UC → BDD → Test → Code) is tested."""
-    test_files = get_all_test_files()
-
-    traceability_tested = False
-
-    for test_file in test_files:
-        content = test_file.read_text().lower()
-
-        if "traceability" in content or "uc-" in content:
-            traceability_tested = True
-            break
+    traceability = keyword_mask("traceability", "uc-")
+    traceability_tested = any(mask & traceability for mask in all_test_keyword_masks)
 
     assert traceability_tested, "Traceability workflow not tested"
 
 
 @pytest.mark.performance
-def test_adr_compliance_tested():
+def test_adr_compliance_tested(all_test_keyword_masks: List[int]):
     """Test that ADR compliance checking is tested."""
-    test_files = get_all_test_files()
-
-    adr_tested = False
-
-    for test_file in test_files:
-        content = test_file.read_text().lower()
-
-        if "adr" in content and "compliance" in content:
-            adr_tested = True
-            break
+    adr_compliance = keyword_mask("adr", "compliance")
+    adr_tested = any(mask & adr_compliance == adr_compliance for mask in all_test_keyword_masks)
 
     assert adr_tested, "ADR compliance not tested"
 
 
 @pytest.mark.performance
-def test_quality_gates_tested():
+def test_quality_gates_tested(all_test_keyword_masks: List[int]):
     """Test that quality gates (score ≥ 80, type hints, etc.) are tested."""
-    test_files = get_all_test_files()
-
-    quality_tested = False
-
-    for test_file in test_files:
-        content = test_file.read_text().lower()
-
-        if ("quality" in content and "score" in content) or "type hint" in content:
-            quality_tested = True
-            break
+    quality_score = keyword_mask("quality", "score")
+    type_hint = keyword_mask("type hint")
+    quality_tested = any(
+        mask & quality_score == quality_score or mask & type_hint for mask in all_test_keyword_masks
+    )
 
     assert quality_tested, "Quality gates not tested"
 
@@ -300,9 +502,7 @@ def test_quality_gates_tested():
 @pytest.mark.performance
 def test_uc_to_bdd_workflow_tested():
     """Test that UC → BDD workflow is tested."""
-    integration_dir = Path(__file__).parent.parent / "integration"
-
-    uc_bdd_test = integration_dir / "test_uc_to_bdd_to_test_chain.py"
+    uc_bdd_test = INTEGRATION_DIR / "test_uc_to_bdd_to_test_chain.py"
 
     assert uc_bdd_test.exists(), "UC → BDD → Test workflow not tested"
 
@@ -310,9 +510,7 @@ def test_uc_to_bdd_workflow_tested():
 @pytest.mark.performance
 def test_feature_development_workflow_tested():
     """Test that complete feature development workflow is tested."""
-    e2e_dir = Path(__file__).parent.parent / "e2e"
-
-    feature_workflow_test = e2e_dir / "test_feature_development_workflow.py"
+    feature_workflow_test = E2E_DIR / "test_feature_development_workflow.py"
 
     assert feature_workflow_test.exists(), "Feature development workflow not tested"
 
@@ -320,9 +518,7 @@ def test_feature_development_workflow_tested():
 @pytest.mark.performance
 def test_iteration_workflow_tested():
     """Test that iteration planning workflow is tested."""
-    e2e_dir = Path(__file__).parent.parent / "e2e"
-
-    iteration_test = e2e_dir / "test_iteration_workflow.py"
+    iteration_test = E2E_DIR / "test_iteration_workflow.py"
 
     assert iteration_test.exists(), "Iteration workflow not tested"
 
@@ -330,9 +526,7 @@ def test_iteration_workflow_tested():
 @pytest.mark.performance
 def test_service_creation_workflow_tested():
     """Test that service creation workflow is tested."""
-    e2e_dir = Path(__file__).parent.parent / "e2e"
-
-    service_test = e2e_dir / "test_service_creation_workflow.py"
+    service_test = E2E_DIR / "test_service_creation_workflow.py"
 
     assert service_test.exists(), "Service creation workflow not tested"
 
@@ -343,19 +537,12 @@ def test_service_creation_workflow_tested():
 
 
 @pytest.mark.performance
-def test_twelve_rules_referenced_in_tests():
+def test_twelve_rules_referenced_in_tests(all_test_sources: List[Tuple[Path, bytes]]):
     """Test that 12 Non-Negotiable Rules are referenced in tests."""
-    test_files = get_all_test_files()
+    corpus = b"\n".join(source for _, source in all_test_sources)
 
-    rules_mentioned = set()
-
-    for test_file in test_files:
-        content = test_file.read_text()
-
-        # Check for rule references
-        for i in range(1, 13):
-            if f"Rule #{i}" in content or f"Rule {i}" in content:
-                rules_mentioned.add(i)
+    # Check for rule references
+    rules_mentioned = {int(rule) for rule in _RULE_REFERENCE_RE.findall(corpus)}
 
     # At least some rules should be explicitly tested
     assert (
@@ -364,35 +551,22 @@ def test_twelve_rules_referenced_in_tests():
 
 
 @pytest.mark.performance
-def test_spec_first_rule_tested():
+def test_spec_first_rule_tested(all_test_keyword_masks: List[int]):
     """Test that Rule #1 (Spec First) is tested."""
-    test_files = get_all_test_files()
-
-    spec_first_tested = False
-
-    for test_file in test_files:
-        content = test_file.read_text().lower()
-
-        if ("spec" in content and "first" in content) or "specification" in content:
-            spec_first_tested = True
-            break
+    spec_first = keyword_mask("spec", "first")
+    specification = keyword_mask("specification")
+    spec_first_tested = any(
+        mask & spec_first == spec_first or mask & specification for mask in all_test_keyword_masks
+    )
 
     assert spec_first_tested, "Rule #1 (Spec First) not explicitly tested"
 
 
 @pytest.mark.performance
-def test_tdd_cycle_rule_tested():
+def test_tdd_cycle_rule_tested(all_test_keyword_masks: List[int]):
     """Test that Rule #2 (TDD Cycle) is tested."""
-    test_files = get_all_test_files()
-
-    tdd_tested = False
-
-    for test_file in test_files:
-        content = test_file.read_text().lower()
-
-        if "red" in content and "green" in content and "refactor" in content:
-            tdd_tested = True
-            break
+    tdd_cycle = keyword_mask("red", "green", "refactor")
+    tdd_tested = any(mask & tdd_cycle == tdd_cycle for mask in all_test_keyword_masks)
 
     assert tdd_tested, "Rule #2 (TDD Cycle) not tested"
 
@@ -403,14 +577,9 @@ def test_tdd_cycle_rule_tested():
 
 
 @pytest.mark.performance
-def test_test_suite_has_minimum_tests():
+def test_test_suite_has_minimum_tests(marker_counts: Counter):
     """Test that test suite has minimum number of tests."""
-    total_tests = (
-        count_tests_by_marker("unit")
-        + count_tests_by_marker("integration")
-        + count_tests_by_marker("e2e")
-        + count_tests_by_marker("performance")
-    )
+    total_tests = sum(marker_counts[marker] for marker in TEST_TYPE_MARKERS)
 
     # For 18 agents, should have at least 400 tests total
     # (Phases 1-7 combined)
@@ -422,36 +591,35 @@ def test_test_suite_has_minimum_tests():
 @pytest.mark.performance
 def test_test_files_organized_by_type():
     """Test that test files are organized by type (unit/integration/e2e/performance)."""
-    test_root = Path(__file__).parent.parent
-
     # Expected directories
     expected_dirs = ["unit", "integration", "e2e", "performance"]
 
     for dir_name in expected_dirs:
-        dir_path = test_root / dir_name
+        dir_path = TEST_ROOT / dir_name
 
         assert dir_path.exists(), f"Missing test directory: {dir_name}"
 
-        # Directory should have test files
-        test_files = list(dir_path.glob("test_*.py"))
+        # Directory should have test files (stop at the first one found)
+        with os.scandir(dir_path) as entries:
+            has_test_files = any(
+                entry.name.startswith("test_") and entry.name.endswith(".py") and entry.is_file()
+                for entry in entries
+            )
 
-        assert len(test_files) > 0, f"No test files in {dir_name} directory"
+        assert has_test_files, f"No test files in {dir_name} directory"
 
 
 @pytest.mark.performance
 def test_fixture_helpers_available():
     """Test that test fixtures and helpers are available."""
-    fixtures_dir = Path(__file__).parent.parent / "fixtures"
-
-    assert fixtures_dir.exists(), "Missing fixtures directory"
+    assert FIXTURES_DIR.exists(), "Missing fixtures directory"
 
     # Essential fixtures
     essential_fixtures = ["agent_parser.py", "mock_helpers.py", "__init__.py"]
+    fixture_names = list_dir_names(FIXTURES_DIR)
 
     for fixture_file in essential_fixtures:
-        fixture_path = fixtures_dir / fixture_file
-
-        assert fixture_path.exists(), f"Missing essential fixture: {fixture_file}"
+        assert fixture_file in fixture_names, f"Missing essential fixture: {fixture_file}"
 
 
 # ============================================================================
@@ -489,14 +657,13 @@ def test_identify_coverage_gaps():
 @pytest.mark.performance
 def test_test_suite_documentation_exists():
     """Test that test suite has documentation."""
-    test_root = Path(__file__).parent.parent
-
-    # Should have README or documentation
-    docs = list(test_root.glob("README*")) + list(test_root.glob("*.md"))
+    # Should have README or documentation, here or in tests/ (tests/README.md)
+    doc_names = list_dir_names(TEST_ROOT) | list_dir_names(TEST_ROOT.parent)
+    has_docs = any(name.startswith("README") or name.endswith(".md") for name in doc_names)
 
-    # Documentation is recommended but not required
-    # (This is informational)
-    pass
+    # Documentation is recommended but not required (informational)
+    if not has_docs:
+        warnings.warn("No README or markdown documentation for the test suite", UserWarning)
 
 
 # ============================================================================
@@ -505,35 +672,33 @@ def test_test_suite_documentation_exists():
 
 
 @pytest.mark.performance
-def test_tests_have_docstrings():
+def test_tests_have_docstrings(
+    all_test_sources: List[Tuple[Path, bytes]], all_test_trees: List[ast.Module]
+):
     """Test that test functions have descriptive docstrings."""
-    test_files = get_all_test_files()
-
+    # Every test function matches _TEST_DEF_RE, so this bounds the total from above
+    max_tests = sum(len(_TEST_DEF_RE.findall(source)) for _, source in all_test_sources)
     tests_without_docstrings = 0
     total_tests = 0
 
-    for test_file in test_files:
-        content = test_file.read_text()
-        lines = content.split("\n")
-
-        in_test_function = False
-        has_docstring = False
+    for tree in all_test_trees:
+        for node in ast.walk(tree):
+            is_function = isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
 
-        for i, line in enumerate(lines):
-            if line.strip().startswith("def test_"):
-                in_test_function = True
-                has_docstring = False
+            if is_function and node.name.startswith("test_"):
                 total_tests += 1
-
-            elif in_test_function:
-                if '"""' in line or "'''" in line:
-                    has_docstring = True
-                    in_test_function = False
-                elif line.strip() and not line.strip().startswith("@"):
-                    # Function body started without docstring
-                    if not has_docstring:
-                        tests_without_docstrings += 1
-                    in_test_function = False
+                if ast.get_docstring(node) is None:
+                    tests_without_docstrings += 1
+
+        # Stop early once the outcome no longer depends on the remaining files;
+        # otherwise (empty suite, or the bound not holding) use the exact check
+        if 0 < max_tests and total_tests <= max_tests:
+            documented = total_tests - tests_without_docstrings
+            if documented * 10 >= max_tests * 7:
+                return
+            assert (
+                tests_without_docstrings * 10 <= max_tests * 3
+            ), f"At least {tests_without_docstrings} tests lack docstrings (expected ≥ 70%)"
 
     # Most tests should have docstrings (≥ 80%)
     docstring_percentage = (
@@ -546,26 +711,16 @@ def test_tests_have_docstrings():
 
 
 @pytest.mark.performance
-def test_test_suite_summary_metrics():
+def test_test_suite_summary_metrics(marker_counts: Counter):
     """Generate summary metrics for test suite."""
     # Collect all metrics
     metrics = {
         "total_agents": len(list(get_all_agent_paths())),
         "tested_agents": len(get_tested_agents()),
-        "unit_tests": count_tests_by_marker("unit"),
-        "integration_tests": count_tests_by_marker("integration"),
-        "e2e_tests": count_tests_by_marker("e2e"),
-        "performance_tests": count_tests_by_marker("performance"),
+        **{f"{marker}_tests": marker_counts[marker] for marker in TEST_TYPE_MARKERS},
     }
 
-    metrics["total_tests"] = sum(
-        [
-            metrics["unit_tests"],
-            metrics["integration_tests"],
-            metrics["e2e_tests"],
-            metrics["performance_tests"],
-        ]
-    )
+    metrics["total_tests"] = sum(marker_counts[marker] for marker in TEST_TYPE_MARKERS)
 
     metrics["agent_coverage"] = (
         (metrics["tested_agents"] / metrics["total_agents"] * 100)
@@ -0,0 +1,55 @@
+"""Tests for the collection hooks in tests/agents/conftest.py.
+
+Test Coverage:
+- Performance tests are skipped only when -m cannot select them
+"""
+
+import pytest
+
+from tests.agents import conftest
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+# -m expressions and whether the performance directory must still be collected
+MARKEXPR_CASES = [
+    pytest.param("", True, id="no-expression"),
+    pytest.param("performance", True, id="performance"),
+    pytest.param("unit or performance", True, id="unit-or-performance"),
+    pytest.param("not unit", True, id="not-unit"),
+    pytest.param("not integration", True, id="not-integration"),
+    pytest.param("not slow", True, id="not-slow"),
+    pytest.param("unit", False, id="unit"),
+    pytest.param("unit or e2e", False, id="unit-or-e2e"),
+    pytest.param("integration and slow", False, id="integration-and-slow"),
+]
+
+
+class StubConfig:
+    """Minimal stand-in for pytest.Config exposing only the -m option."""
+
+    def __init__(self, markexpr: str):
+        self.markexpr = markexpr
+
+    def getoption(self, name: str) -> str:
+        assert name == "markexpr"
+        return self.markexpr
+
+
+# ============================================================================
+# Test: Performance Collection
+# ============================================================================
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("markexpr,collected", MARKEXPR_CASES)
+def test_performance_tests_collected_when_selectable(
+    monkeypatch: pytest.MonkeyPatch, markexpr: str, collected: bool
+):
+    """Test that performance/ is ignored only when -m cannot select its tests."""
+    monkeypatch.setattr(conftest, "collect_ignore_glob", [])
+
+    conftest.pytest_configure(StubConfig(markexpr))
+
+    assert ("performance" not in conftest.collect_ignore_glob) == collected
@@ -0,0 +1,35 @@
+"""Shared fixtures for agent unit tests."""
+
+import pytest
+from typing import Dict
+
+from tests.agents.fixtures import AGENT_PATHS, AgentParser
+
+# ============================================================================
+# Agent Parametrization
+# ============================================================================
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize tests requesting ``agent_parser`` over every agent file.
+
+    Parameters are attached only to tests that actually use the fixture,
+    and each resolves to the session-cached parser for that agent. Modules
+    that test a single agent set ``AGENT_NAME`` and are not parametrized.
+    """
+    if "agent_parser" in metafunc.fixturenames and not hasattr(metafunc.module, "AGENT_NAME"):
+        metafunc.parametrize(
+            "agent_parser",
+            AGENT_PATHS,
+            ids=[path.stem for path in AGENT_PATHS],
+            indirect=True,
+        )
+
+
+@pytest.fixture(scope="module")
+def agent_parser(request, all_agent_parsers: Dict[str, AgentParser]) -> AgentParser:
+    """Parser for the module's ``AGENT_NAME`` or the agent selected by pytest_generate_tests."""
+    agent_name = getattr(request.module, "AGENT_NAME", None)
+    if agent_name is None:
+        agent_name = request.param.stem
+    return all_agent_parsers[agent_name]
@@ -10,12 +10,13 @@ Test Coverage:
 """
 
 import pytest
-from pathlib import Path
+import re
+import yaml
+from collections import Counter
 from typing import List
 
 from tests.agents.fixtures import AgentParser
 
-
 # ============================================================================
 # Constants
 # ============================================================================
@@ -37,27 +38,62 @@ VALID_CLAUDE_TOOLS = [
 
 VALID_MODELS = ["opus", "sonnet", "sonnet-3-5", "claude-3-5-sonnet-20241022"]
 
+# Sets for O(1) membership checks; the lists above keep display order
+VALID_CLAUDE_TOOLS_SET = frozenset(VALID_CLAUDE_TOOLS)
+VALID_MODELS_SET = frozenset(VALID_MODELS)
 
-# ============================================================================
-# Fixtures
-# ============================================================================
-
-
-@pytest.fixture
-def all_agents(agents_dir: Path) -> List[AgentParser]:
-    """Load all agent parsers."""
-    return [AgentParser(f) for f in agents_dir.glob("*.md")]
-
-
-@pytest.fixture(
-    params=[
-        f
-        for f in (Path(__file__).parent.parent.parent.parent / ".claude" / "subagents").glob("*.md")
-    ]
+# Agents whose descriptions should mention rules or framework concepts
+RULE_RELATED_AGENTS = frozenset(
+    {
+        "test-writer",
+        "uc-writer",
+        "bdd-scenario-writer",
+        "spec-validator",
+        "code-quality-checker",
+        "refactoring-analyzer",
+        "adr-manager",
+        "git-workflow-helper",
+    }
 )
-def agent_parser(request) -> AgentParser:
-    """Parametrized fixture providing individual agent parsers."""
-    return AgentParser(request.param)
+
+# Description keywords, each list compiled into a single alternation
+ROLE_KEYWORDS = ["agent", "specialist", "expert", "helper"]
+
+FRAMEWORK_KEYWORDS = ["rule", "framework", "spec", "test", "quality", "discipline"]
+
+ROLE_PATTERN = re.compile("|".join(map(re.escape, ROLE_KEYWORDS)))
+FRAMEWORK_PATTERN = re.compile("|".join(map(re.escape, FRAMEWORK_KEYWORDS)))
+
+# Front matter the flat parser must either decline or read exactly as PyYAML does
+FLAT_FRONT_MATTER_CASES = [
+    pytest.param(
+        "name: test-writer\ndescription: Writes tests\ntools: [Read, Write]\nmodel: sonnet\n",
+        id="agent-front-matter",
+    ),
+    pytest.param("tools: []", id="empty-list"),
+    pytest.param("flag: yes", id="yes-value"),
+    pytest.param("flag: On", id="on-value"),
+    pytest.param("flag: null", id="null-value"),
+    pytest.param("tools: [Read, yes]", id="yes-list-item"),
+    pytest.param("yes: x", id="yes-key"),
+    pytest.param("On: x", id="on-key"),
+    pytest.param("null: x", id="null-key"),
+    pytest.param("a: b: c", id="nested-mapping"),
+    pytest.param("a: x #c", id="trailing-comment"),
+    pytest.param("a: x#c", id="hash-without-space"),
+    pytest.param("tools: [a,,b]", id="empty-list-item"),
+    pytest.param("tools: [a, b,]", id="trailing-comma"),
+    pytest.param("description: first line\n  continued", id="indented-continuation"),
+    pytest.param("url: http://example.com/path", id="url-value"),
+    pytest.param("a: x\ty", id="tab-in-value"),
+    pytest.param("a: x\n\t\n", id="tab-only-line"),
+    pytest.param("name: test-writer\r\nmodel: sonnet\r\n", id="crlf-line-endings"),
+    pytest.param("name: test-writer\rmodel: sonnet", id="bare-cr"),
+    pytest.param("a: 1", id="integer-value"),
+    pytest.param("a: ~", id="tilde-value"),
+    pytest.param("a: 'x'", id="quoted-value"),
+    pytest.param("", id="empty"),
+]
 
 
 # ============================================================================
@@ -65,15 +101,6 @@ def agent_parser(request) -> AgentParser:
 # ============================================================================
 
 
-def test_all_agents_have_yaml_frontmatter(all_agents: List[AgentParser]):
-    """Test that all agents have YAML front matter."""
-    agents_without_frontmatter = [agent.name for agent in all_agents if not agent.has_frontmatter]
-
-    assert (
-        not agents_without_frontmatter
-    ), f"Agents missing YAML front matter: {', '.join(agents_without_frontmatter)}"
-
-
 @pytest.mark.unit
 def test_agent_has_valid_yaml_frontmatter(agent_parser: AgentParser):
     """Test that agent has valid YAML front matter."""
@@ -84,6 +111,20 @@ def test_agent_has_valid_yaml_frontmatter(agent_parser: AgentParser):
     ), f"Agent {agent_parser.name} has invalid YAML (not a dict)"
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("text", FLAT_FRONT_MATTER_CASES)
+def test_flat_front_matter_matches_yaml(text: str):
+    """Test that the flat front matter fast path never disagrees with PyYAML."""
+    try:
+        expected = yaml.safe_load(text)
+    except yaml.YAMLError:
+        expected = None
+
+    parsed = AgentParser._parse_flat_front_matter(text)
+
+    assert parsed is None or parsed == expected, f"{text!r}: {parsed!r} != {expected!r}"
+
+
 # ============================================================================
 # Test: Required Fields
 # ============================================================================
@@ -101,20 +142,6 @@ def test_agent_has_required_metadata_fields(agent_parser: AgentParser):
     ), f"Agent {agent_parser.name} missing required fields: {', '.join(missing_fields)}"
 
 
-def test_all_agents_have_complete_metadata(all_agents: List[AgentParser]):
-    """Test that all agents have complete metadata."""
-    incomplete_agents = []
-
-    for agent in all_agents:
-        missing = [field for field in REQUIRED_METADATA_FIELDS if field not in agent.metadata]
-        if missing:
-            incomplete_agents.append(f"{agent.name} (missing: {', '.join(missing)})")
-
-    assert not incomplete_agents, f"Agents with incomplete metadata:\n" + "\n".join(
-        f"  - {a}" for a in incomplete_agents
-    )
-
-
 # ============================================================================
 # Test: Field Values
 # ============================================================================
@@ -143,8 +170,8 @@ def test_agent_description_is_comprehensive(agent_parser: AgentParser):
 
     # Check that description mentions key aspects
     lower_desc = description.lower()
-    assert any(
-        keyword in lower_desc for keyword in ["agent", "specialist", "expert", "helper"]
+    assert (
+        ROLE_PATTERN.search(lower_desc) is not None
     ), f"Agent {agent_parser.name}: description should identify agent role"
 
 
@@ -153,11 +180,14 @@ def test_agent_tools_are_valid(agent_parser: AgentParser):
     """Test that agent tools list contains only valid Claude Code tools."""
     tools = agent_parser.get_metadata_field("tools")
 
-    assert isinstance(tools, list), f"Agent {agent_parser.name}: tools must be a list"
+    # The parser stores YAML lists as tuples
+    assert isinstance(
+        tools, tuple
+    ), f"Agent {agent_parser.name}: tools must be a list of tool names"
 
     assert len(tools) > 0, f"Agent {agent_parser.name}: tools list cannot be empty"
 
-    invalid_tools = [tool for tool in tools if tool not in VALID_CLAUDE_TOOLS]
+    invalid_tools = [tool for tool in tools if tool not in VALID_CLAUDE_TOOLS_SET]
 
     assert not invalid_tools, (
         f"Agent {agent_parser.name}: invalid tools: {', '.join(invalid_tools)}\n"
@@ -172,7 +202,7 @@ def test_agent_model_is_supported(agent_parser: AgentParser):
 
     assert isinstance(model, str), f"Agent {agent_parser.name}: model must be a string"
 
-    assert model in VALID_MODELS, (
+    assert model in VALID_MODELS_SET, (
         f"Agent {agent_parser.name}: invalid model '{model}'\n"
         f"Valid models: {', '.join(VALID_MODELS)}"
     )
@@ -187,11 +217,16 @@ def test_metadata_coverage_report(all_agents: List[AgentParser]):
     """Generate a report of metadata coverage across all agents."""
     total_agents = len(all_agents)
 
-    # Count agents with each field
-    field_coverage = {}
-    for field in REQUIRED_METADATA_FIELDS:
-        count = sum(1 for agent in all_agents if field in agent.metadata)
-        field_coverage[field] = count
+    # Count field coverage, tools and models in a single pass over the agents
+    field_coverage = Counter({field: 0 for field in REQUIRED_METADATA_FIELDS})
+    all_tools = set()
+    models_used = Counter()
+
+    for agent in all_agents:
+        metadata = agent.metadata
+        field_coverage.update(field for field in REQUIRED_METADATA_FIELDS if field in metadata)
+        all_tools.update(metadata.get("tools") or [])
+        models_used[metadata.get("model")] += 1
 
     # Report
     print(f"\n{'='*60}")
@@ -203,23 +238,11 @@ def test_metadata_coverage_report(all_agents: List[AgentParser]):
         status = "✓" if count == total_agents else "✗"
         print(f"  {status} {field}: {count}/{total_agents} ({percentage:.0f}%)")
 
-    # Count unique tools used
-    all_tools = set()
-    for agent in all_agents:
-        tools = agent.get_metadata_field("tools") or []
-        all_tools.update(tools)
-
     print(f"\nTools used across agents: {len(all_tools)}")
     print(f"  {', '.join(sorted(all_tools))}")
 
-    # Count models used
-    models_used = {}
-    for agent in all_agents:
-        model = agent.get_metadata_field("model")
-        models_used[model] = models_used.get(model, 0) + 1
-
     print(f"\nModels distribution:")
-    for model, count in sorted(models_used.items(), key=lambda x: x[1], reverse=True):
+    for model, count in models_used.most_common():
         percentage = (count / total_agents) * 100
         print(f"  {model}: {count} agents ({percentage:.0f}%)")
 
@@ -239,9 +262,9 @@ def test_metadata_coverage_report(all_agents: List[AgentParser]):
 def test_agents_have_unique_names(all_agents: List[AgentParser]):
     """Test that all agent names are unique."""
     names = [agent.name for agent in all_agents]
-    duplicates = [name for name in names if names.count(name) > 1]
+    duplicates = [name for name, count in Counter(names).items() if count > 1]
 
-    assert not duplicates, f"Duplicate agent names found: {', '.join(set(duplicates))}"
+    assert not duplicates, f"Duplicate agent names found: {', '.join(duplicates)}"
 
 
 def test_agents_have_distinct_descriptions(all_agents: List[AgentParser]):
@@ -250,11 +273,13 @@ def test_agents_have_distinct_descriptions(all_agents: List[AgentParser]):
 
     # Check for exact duplicates
     unique_descriptions = set(descriptions)
-    duplicates = [desc for desc in descriptions if descriptions.count(desc) > 1]
 
-    assert len(unique_descriptions) == len(
-        descriptions
-    ), f"Found {len(descriptions) - len(unique_descriptions)} duplicate descriptions"
+    if len(unique_descriptions) != len(descriptions):
+        duplicates = [desc for desc, count in Counter(descriptions).items() if count > 1]
+        pytest.fail(
+            f"Found {len(descriptions) - len(unique_descriptions)} duplicate descriptions: "
+            f"{duplicates}"
+        )
 
 
 @pytest.mark.unit
@@ -263,23 +288,8 @@ def test_agent_description_mentions_framework_rules(agent_parser: AgentParser):
     description = agent_parser.get_metadata_field("description")
     name = agent_parser.name
 
-    # Agents that should mention rules or framework concepts
-    rule_related_agents = [
-        "test-writer",
-        "uc-writer",
-        "bdd-scenario-writer",
-        "spec-validator",
-        "code-quality-checker",
-        "refactoring-analyzer",
-        "adr-manager",
-        "git-workflow-helper",
-    ]
-
-    if name in rule_related_agents:
+    if name in RULE_RELATED_AGENTS:
         lower_desc = description.lower()
-        mentions_framework = any(
-            keyword in lower_desc
-            for keyword in ["rule", "framework", "spec", "test", "quality", "discipline"]
-        )
+        mentions_framework = FRAMEWORK_PATTERN.search(lower_desc) is not None
 
         assert mentions_framework, f"Agent {name} should mention framework concepts in description"
@@ -10,14 +10,15 @@ Test Coverage:
 - Code examples and documentation
 """
 
+import heapq
 import pytest
+import re
+import sys
 import warnings
-from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from tests.agents.fixtures import AgentParser
 
-
 # ============================================================================
 # Constants
 # ============================================================================
@@ -29,27 +30,68 @@ RECOMMENDED_SECTIONS = ["Next Steps", "Anti-Patterns"]
 # Anti-pattern section can have variations
 ANTIPATTERN_VARIATIONS = ["Anti-Patterns", "Anti-patterns", "Antipatterns"]
 
+# Set for checking an agent's section titles with set operations
+ANTIPATTERN_VARIATIONS_SET = frozenset(ANTIPATTERN_VARIATIONS)
+
+# Process steps should start with one of these; a tuple so str.startswith
+# checks them all in one call
+ACTION_VERBS = (
+    "read",
+    "write",
+    "parse",
+    "generate",
+    "create",
+    "analyze",
+    "extract",
+    "validate",
+    "verify",
+    "check",
+    "run",
+    "execute",
+    "identify",
+    "design",
+    "implement",
+    "test",
+    "add",
+    "ensure",
+    "document",
+    "update",
+    "ask",
+    "gather",
+    "determine",
+    "build",
+    "scan",
+    "detect",
+    "calculate",
+    "compare",
+    "suggest",
+    "review",
+)
 
-# ============================================================================
-# Fixtures
-# ============================================================================
-
+# Keyword lists are compiled into one alternation each, so a text is scanned
+# once per list instead of once per keyword
+QUALITY_ASPECTS = ["spec", "test", "quality", "coverage", "validation", "file", "output"]
 
-@pytest.fixture
-def all_agents(agents_dir: Path) -> List[AgentParser]:
-    """Load all agent parsers."""
-    return [AgentParser(f) for f in agents_dir.glob("*.md")]
+NEGATION_WORDS = ["not", "never", "don't", "avoid", "no", "without", "missing", "skip", "weak"]
 
+DELIVERABLE_KEYWORDS = [
+    "file",
+    "content",
+    "result",
+    "report",
+    "generate",
+    "create",
+    "output",
+    "produce",
+    "return",
+    "deliver",
+    "provide",
+]
 
-@pytest.fixture(
-    params=[
-        f
-        for f in (Path(__file__).parent.parent.parent.parent / ".claude" / "subagents").glob("*.md")
-    ]
-)
-def agent_parser(request) -> AgentParser:
-    """Parametrized fixture providing individual agent parsers."""
-    return AgentParser(request.param)
+# Lookahead so overlapping aspects are all reported
+QUALITY_ASPECT_PATTERN = re.compile(f"(?=({'|'.join(map(re.escape, QUALITY_ASPECTS))}))")
+NEGATION_PATTERN = re.compile("|".join(map(re.escape, NEGATION_WORDS)))
+DELIVERABLE_PATTERN = re.compile("|".join(map(re.escape, DELIVERABLE_KEYWORDS)))
 
 
 # ============================================================================
@@ -88,9 +130,7 @@ def test_agent_has_quality_checks_section(agent_parser: AgentParser):
 @pytest.mark.unit
 def test_agent_has_antipatterns_section(agent_parser: AgentParser):
     """Test that agent has Anti-Patterns section (any variation)."""
-    has_antipatterns = any(
-        agent_parser.has_section(variation) for variation in ANTIPATTERN_VARIATIONS
-    )
+    has_antipatterns = agent_parser.has_any_section(ANTIPATTERN_VARIATIONS_SET)
 
     assert has_antipatterns, (
         f"Agent {agent_parser.name} missing Anti-Patterns section "
@@ -104,30 +144,6 @@ def test_agent_has_files_section(agent_parser: AgentParser):
     assert agent_parser.has_section("Files"), f"Agent {agent_parser.name} missing Files section"
 
 
-def test_all_agents_have_required_sections(all_agents: List[AgentParser]):
-    """Test that all agents have all required sections."""
-    incomplete_agents = []
-
-    for agent in all_agents:
-        missing = []
-
-        for section in REQUIRED_SECTIONS:
-            if not agent.has_section(section):
-                missing.append(section)
-
-        # Check anti-patterns (any variation)
-        has_antipatterns = any(agent.has_section(var) for var in ANTIPATTERN_VARIATIONS)
-        if not has_antipatterns:
-            missing.append("Anti-Patterns")
-
-        if missing:
-            incomplete_agents.append(f"{agent.name}: missing {', '.join(missing)}")
-
-    assert not incomplete_agents, f"Agents with incomplete sections:\n" + "\n".join(
-        f"  - {a}" for a in incomplete_agents
-    )
-
-
 # ============================================================================
 # Test: Process Section Format
 # ============================================================================
@@ -151,45 +167,8 @@ def test_process_steps_are_actionable(agent_parser: AgentParser):
     if not steps:
         pytest.skip(f"Agent {agent_parser.name} has no extractable process steps")
 
-    action_verbs = [
-        "read",
-        "write",
-        "parse",
-        "generate",
-        "create",
-        "analyze",
-        "extract",
-        "validate",
-        "verify",
-        "check",
-        "run",
-        "execute",
-        "identify",
-        "design",
-        "implement",
-        "test",
-        "add",
-        "ensure",
-        "document",
-        "update",
-        "ask",
-        "gather",
-        "determine",
-        "build",
-        "scan",
-        "detect",
-        "calculate",
-        "compare",
-        "suggest",
-        "review",
-    ]
-
     # Check if steps start with action verbs
-    actionable_steps = []
-    for step in steps:
-        step_lower = step.lower()
-        is_actionable = any(step_lower.startswith(verb) for verb in action_verbs)
-        actionable_steps.append(is_actionable)
+    actionable_steps = [step.startswith(ACTION_VERBS) for step in agent_parser.process_steps_lower]
 
     # At least 50% of steps should be actionable
     actionable_percentage = sum(actionable_steps) / len(steps)
@@ -225,11 +204,11 @@ def test_quality_checks_cover_key_aspects(agent_parser: AgentParser):
     if not checkboxes:
         pytest.skip(f"Agent {agent_parser.name} has no checkboxes in Quality Checks")
 
-    content = " ".join(checkboxes).lower()
+    content = agent_parser.get_section_checkboxes_text("Quality Checks")
 
     # Should mention at least 2 of these aspects
-    aspects = ["spec", "test", "quality", "coverage", "validation", "file", "output"]
-    found_aspects = [aspect for aspect in aspects if aspect in content]
+    matched = set(QUALITY_ASPECT_PATTERN.findall(content))
+    found_aspects = [aspect for aspect in QUALITY_ASPECTS if aspect in matched]
 
     assert len(found_aspects) >= 2, (
         f"Agent {agent_parser.name}: Quality Checks should cover multiple aspects "
@@ -261,11 +240,9 @@ def test_antipatterns_provide_guidance(agent_parser: AgentParser):
         pytest.skip(f"Agent {agent_parser.name} has no extractable anti-patterns")
 
     # Anti-patterns should contain negation or warning words
-    negations = ["not", "never", "don't", "avoid", "no", "without", "missing", "skip", "weak"]
-
     patterns_with_negation = []
     for pattern in antipatterns:
-        has_negation = any(neg in pattern.lower() for neg in negations)
+        has_negation = NEGATION_PATTERN.search(pattern.lower()) is not None
         patterns_with_negation.append(has_negation)
 
     # At least 60% should have clear negation
@@ -290,9 +267,10 @@ def test_files_section_lists_operations(agent_parser: AgentParser):
 
     assert files_section, f"Agent {agent_parser.name} missing Files section"
 
-    # Should mention Read and/or Write operations
-    has_read = "Read:" in files_section or "read:" in files_section.lower()
-    has_write = "Write:" in files_section or "write:" in files_section.lower()
+    # Should mention Read and/or Write operations ("Read:" is covered by the lowercase check)
+    files_lower = agent_parser.sections_lower["Files"]
+    has_read = "read:" in files_lower
+    has_write = "write:" in files_lower
 
     assert (
         has_read or has_write
@@ -372,21 +350,8 @@ def test_output_section_describes_deliverables(agent_parser: AgentParser):
     assert output_section, f"Agent {agent_parser.name} missing Output section"
 
     # Should mention files, content, results, or deliverables
-    keywords = [
-        "file",
-        "content",
-        "result",
-        "report",
-        "generate",
-        "create",
-        "output",
-        "produce",
-        "return",
-        "deliver",
-        "provide",
-    ]
-
-    has_deliverable = any(kw in output_section.lower() for kw in keywords)
+    output_lower = agent_parser.sections_lower["Output"]
+    has_deliverable = DELIVERABLE_PATTERN.search(output_lower) is not None
 
     assert has_deliverable, (
         f"Agent {agent_parser.name}: Output section should describe deliverables "
@@ -416,72 +381,80 @@ def test_structure_consistency_report(all_agents: List[AgentParser]):
 
     all_required = REQUIRED_SECTIONS + ["Anti-Patterns"]
 
-    print(f"\n{'='*70}")
-    print(f"Agent Structure Consistency Report ({len(all_agents)} agents)")
-    print(f"{'='*70}\n")
+    section_matrix: List[List[bool]] = []
+    agents_with_examples = 0
+    step_counts: List[Tuple[str, int]] = []
+    qc_counts: List[int] = []
 
-    # Check each required section
-    print("Required Sections:")
-    for section in all_required:
-        if section == "Anti-Patterns":
-            # Check variations
-            agents_with_section = sum(
-                1
-                for agent in all_agents
-                if any(agent.has_section(var) for var in ANTIPATTERN_VARIATIONS)
-            )
-        else:
-            agents_with_section = sum(1 for agent in all_agents if agent.has_section(section))
+    # Gather every per-agent metric in a single pass over the agents. Each
+    # matrix row holds section flags: required sections, any anti-pattern
+    # variation, then recommended sections; columns are summed afterwards
+    for agent in all_agents:
+        titles = agent.section_titles
+        section_matrix.append(
+            [section in titles for section in REQUIRED_SECTIONS]
+            + [agent.has_any_section(ANTIPATTERN_VARIATIONS_SET)]
+            + [section in titles for section in RECOMMENDED_SECTIONS]
+        )
+        if agent.extract_code_blocks():
+            agents_with_examples += 1
+        step_counts.append((agent.name, agent.count_process_steps()))
+        qc_counts.append(agent.count_section_checkboxes("Quality Checks"))
+
+    section_counts = [sum(column) for column in zip(*section_matrix)]
+    required_counts = section_counts[: len(all_required)]
+    recommended_counts = section_counts[len(all_required) :]
 
+    # Build the report in memory and write it in one call
+    out: List[str] = []
+    out.append(f"\n{'='*70}\n")
+    out.append(f"Agent Structure Consistency Report ({len(all_agents)} agents)\n")
+    out.append(f"{'='*70}\n\n")
+
+    # Check each required section
+    out.append("Required Sections:\n")
+    for section, agents_with_section in zip(all_required, required_counts):
         percentage = (agents_with_section / len(all_agents)) * 100
         status = "✓" if percentage == 100 else "⚠"
 
-        print(f"  {status} {section}: {agents_with_section}/{len(all_agents)} ({percentage:.0f}%)")
+        out.append(
+            f"  {status} {section}: {agents_with_section}/{len(all_agents)} ({percentage:.0f}%)\n"
+        )
 
     # Check recommended sections
-    print("\nRecommended Sections:")
-    for section in RECOMMENDED_SECTIONS:
-        agents_with_section = sum(1 for agent in all_agents if agent.has_section(section))
+    out.append("\nRecommended Sections:\n")
+    for section, agents_with_section in zip(RECOMMENDED_SECTIONS, recommended_counts):
         percentage = (agents_with_section / len(all_agents)) * 100
-        print(f"    {section}: {agents_with_section}/{len(all_agents)} ({percentage:.0f}%)")
+        out.append(f"    {section}: {agents_with_section}/{len(all_agents)} ({percentage:.0f}%)\n")
 
     # Code examples
-    agents_with_examples = sum(1 for agent in all_agents if agent.extract_code_blocks())
     percentage = (agents_with_examples / len(all_agents)) * 100
-    print(f"\nCode Examples:")
-    print(f"    {agents_with_examples}/{len(all_agents)} agents ({percentage:.0f}%)")
+    out.append(f"\nCode Examples:\n")
+    out.append(f"    {agents_with_examples}/{len(all_agents)} agents ({percentage:.0f}%)\n")
 
     # Process steps distribution
-    print(f"\nProcess Steps Distribution:")
-    step_counts = [(agent.name, len(agent.extract_process_steps())) for agent in all_agents]
-    step_counts.sort(key=lambda x: x[1], reverse=True)
+    out.append(f"\nProcess Steps Distribution:\n")
 
-    print(f"  Top 5:")
-    for name, count in step_counts[:5]:
-        print(f"    {name}: {count} steps")
+    # Only the extremes are printed, so select them without sorting everything
+    out.append(f"  Top 5:\n")
+    for name, count in heapq.nlargest(5, step_counts, key=lambda x: x[1]):
+        out.append(f"    {name}: {count} steps\n")
 
-    print(f"  Bottom 5:")
-    for name, count in step_counts[-5:]:
-        print(f"    {name}: {count} steps")
+    out.append(f"  Bottom 5:\n")
+    for name, count in reversed(heapq.nsmallest(5, step_counts, key=lambda x: x[1])):
+        out.append(f"    {name}: {count} steps\n")
 
     # Quality check distribution
-    print(f"\nQuality Checks Distribution:")
-    qc_counts = [
-        (agent.name, len(agent.get_section_checkboxes("Quality Checks"))) for agent in all_agents
-    ]
-    qc_counts.sort(key=lambda x: x[1], reverse=True)
-
-    avg_qc = sum(c for _, c in qc_counts) / len(qc_counts)
-    print(f"  Average: {avg_qc:.1f} checks per agent")
-    print(f"  Range: {qc_counts[-1][1]} - {qc_counts[0][1]} checks")
-
-    print(f"{'='*70}\n")
-
-    # All required sections should be 100%
-    all_complete = all(
-        all(agent.has_section(sec) for sec in REQUIRED_SECTIONS)
-        and any(agent.has_section(var) for var in ANTIPATTERN_VARIATIONS)
-        for agent in all_agents
-    )
+    out.append(f"\nQuality Checks Distribution:\n")
+
+    avg_qc = sum(qc_counts) / len(qc_counts)
+    out.append(f"  Average: {avg_qc:.1f} checks per agent\n")
+    out.append(f"  Range: {min(qc_counts)} - {max(qc_counts)} checks\n")
+
+    out.append(f"{'='*70}\n\n")
+    sys.stdout.write("".join(out))
+
+    # All required sections should be 100%, reusing the counts reported above
+    all_complete = all(count == len(all_agents) for count in required_counts)
 
     assert all_complete, "Not all agents have complete required sections"
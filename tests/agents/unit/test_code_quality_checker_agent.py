@@ -18,21 +18,26 @@ Test Coverage:
 """
 
 import pytest
-from pathlib import Path
 from typing import List
 
-from tests.agents.fixtures import AgentParser
+from tests.agents.fixtures import AgentParser, find_keywords
+
+# Agent under test; the shared agent_parser fixture resolves it by name
+AGENT_NAME = "code-quality-checker"
 
 
 # ============================================================================
-# Fixtures
+# Constants
 # ============================================================================
 
+STATIC_ANALYSIS_TOOLS = frozenset({"pylint", "flake8", "mypy", "radon"})
+
+# Tools whose results are checked and reported (radon only feeds the score)
+REPORTED_TOOLS = frozenset({"pylint", "flake8", "mypy"})
+
+CHECKLIST_TOPICS = frozenset({"checklist", "static analysis", "type safety", "documentation"})
 
-@pytest.fixture
-def code_quality_checker_parser(agents_dir: Path) -> AgentParser:
-    """Parser for code-quality-checker agent."""
-    return AgentParser(agents_dir / "code-quality-checker.md")
+SEVERITY_LEVELS = frozenset({"CRITICAL", "HIGH", "MEDIUM", "LOW"})
 
 
 # ============================================================================
@@ -41,13 +46,13 @@ def code_quality_checker_parser(agents_dir: Path) -> AgentParser:
 
 
 @pytest.mark.unit
-def test_code_quality_checker_has_correct_metadata(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_has_correct_metadata(agent_parser: AgentParser):
     """Test that code-quality-checker has correct metadata."""
-    assert code_quality_checker_parser.name == "code-quality-checker"
-    assert code_quality_checker_parser.get_metadata_field("model") == "sonnet"
+    assert agent_parser.name == "code-quality-checker"
+    assert agent_parser.get_metadata_field("model") == "sonnet"
 
     # Should have tools for reading code and running tools
-    tools = code_quality_checker_parser.get_metadata_field("tools")
+    tools = agent_parser.get_metadata_field("tools")
     assert "Read" in tools
     assert "Bash" in tools  # For running quality tools
     assert "Glob" in tools  # For finding files
@@ -60,43 +65,37 @@ def test_code_quality_checker_has_correct_metadata(code_quality_checker_parser:
 
 
 @pytest.mark.unit
-def test_code_quality_checker_covers_static_analysis(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_covers_static_analysis(agent_parser: AgentParser):
     """Test that agent covers static analysis tools."""
-    responsibilities = code_quality_checker_parser.get_section("Responsibilities")
-    content = responsibilities.lower()
+    content = agent_parser.get_section_lower("Responsibilities")
+    found = find_keywords(content, STATIC_ANALYSIS_TOOLS)
 
-    assert "pylint" in content
-    assert "flake8" in content
-    assert "mypy" in content
-    assert "radon" in content
+    assert found == STATIC_ANALYSIS_TOOLS, f"Missing tools: {sorted(STATIC_ANALYSIS_TOOLS - found)}"
 
 
 @pytest.mark.unit
-def test_code_quality_checker_covers_type_hints(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_covers_type_hints(agent_parser: AgentParser):
     """Test that agent covers type hint validation."""
-    responsibilities = code_quality_checker_parser.get_section("Responsibilities")
-    assert "type hint" in responsibilities.lower()
+    assert "type hint" in agent_parser.get_section_lower("Responsibilities")
 
 
 @pytest.mark.unit
-def test_code_quality_checker_covers_docstrings(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_covers_docstrings(agent_parser: AgentParser):
     """Test that agent covers docstring validation."""
-    responsibilities = code_quality_checker_parser.get_section("Responsibilities")
-    assert "docstring" in responsibilities.lower()
+    assert "docstring" in agent_parser.get_section_lower("Responsibilities")
 
 
 @pytest.mark.unit
-def test_code_quality_checker_covers_complexity(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_covers_complexity(agent_parser: AgentParser):
     """Test that agent covers complexity measurement."""
-    responsibilities = code_quality_checker_parser.get_section("Responsibilities")
-    assert "complexity" in responsibilities.lower() or "cyclomatic" in responsibilities.lower()
+    responsibilities = agent_parser.get_section_lower("Responsibilities")
+    assert "complexity" in responsibilities or "cyclomatic" in responsibilities
 
 
 @pytest.mark.unit
-def test_code_quality_checker_covers_code_smells(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_covers_code_smells(agent_parser: AgentParser):
     """Test that agent covers code smell detection."""
-    responsibilities = code_quality_checker_parser.get_section("Responsibilities")
-    content = responsibilities.lower()
+    content = agent_parser.get_section_lower("Responsibilities")
 
     assert "code smell" in content or "magic number" in content or "naming" in content
 
@@ -107,20 +106,18 @@ def test_code_quality_checker_covers_code_smells(code_quality_checker_parser: Ag
 
 
 @pytest.mark.unit
-def test_code_quality_checker_has_comprehensive_checklist(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_has_comprehensive_checklist(agent_parser: AgentParser):
     """Test that agent has comprehensive quality checking checklist."""
-    content = code_quality_checker_parser.content.lower()
+    content = agent_parser.content_lower
+    found = find_keywords(content, CHECKLIST_TOPICS)
 
-    assert "checklist" in content
-    assert "static analysis" in content
-    assert "type safety" in content
-    assert "documentation" in content
+    assert found == CHECKLIST_TOPICS, f"Missing topics: {sorted(CHECKLIST_TOPICS - found)}"
 
 
 @pytest.mark.unit
-def test_code_quality_checker_defines_thresholds(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_defines_thresholds(agent_parser: AgentParser):
     """Test that agent defines quality thresholds."""
-    content = code_quality_checker_parser.content
+    content = agent_parser.content
 
     # Should have numeric thresholds
     assert "8.0" in content or "8" in content  # pylint threshold
@@ -133,31 +130,25 @@ def test_code_quality_checker_defines_thresholds(code_quality_checker_parser: Ag
 
 
 @pytest.mark.unit
-def test_code_quality_checker_process_runs_all_tools(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_process_runs_all_tools(agent_parser: AgentParser):
     """Test that process includes running all quality tools."""
-    process_steps = code_quality_checker_parser.extract_process_steps()
-    process_text = " ".join(process_steps).lower()
+    found = find_keywords(agent_parser.process_steps_text, STATIC_ANALYSIS_TOOLS)
 
-    assert "pylint" in process_text
-    assert "flake8" in process_text
-    assert "mypy" in process_text
-    assert "radon" in process_text
+    assert found == STATIC_ANALYSIS_TOOLS, f"Missing tools: {sorted(STATIC_ANALYSIS_TOOLS - found)}"
 
 
 @pytest.mark.unit
-def test_code_quality_checker_process_generates_report(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_process_generates_report(agent_parser: AgentParser):
     """Test that process includes generating report."""
-    process_steps = code_quality_checker_parser.extract_process_steps()
-    process_text = " ".join(process_steps).lower()
+    process_text = agent_parser.process_steps_text
 
     assert "report" in process_text or "generate" in process_text
 
 
 @pytest.mark.unit
-def test_code_quality_checker_process_calculates_score(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_process_calculates_score(agent_parser: AgentParser):
     """Test that process includes calculating quality score."""
-    process_steps = code_quality_checker_parser.extract_process_steps()
-    process_text = " ".join(process_steps).lower()
+    process_text = agent_parser.process_steps_text
 
     # Score calculation is part of report generation
     assert "score" in process_text or "calculate" in process_text or "report" in process_text
@@ -170,24 +161,21 @@ def test_code_quality_checker_process_calculates_score(code_quality_checker_pars
 
 @pytest.mark.unit
 def test_code_quality_checker_quality_checks_include_tools(
-    code_quality_checker_parser: AgentParser,
+    agent_parser: AgentParser,
 ):
     """Test that quality checks verify tool execution."""
-    checkboxes = code_quality_checker_parser.get_section_checkboxes("Quality Checks")
-    checkboxes_text = " ".join(checkboxes).lower()
+    checkboxes_text = agent_parser.get_section_checkboxes_text("Quality Checks")
+    found = find_keywords(checkboxes_text, REPORTED_TOOLS)
 
-    assert "pylint" in checkboxes_text
-    assert "flake8" in checkboxes_text
-    assert "mypy" in checkboxes_text
+    assert found == REPORTED_TOOLS, f"Missing tools: {sorted(REPORTED_TOOLS - found)}"
 
 
 @pytest.mark.unit
 def test_code_quality_checker_quality_checks_include_score(
-    code_quality_checker_parser: AgentParser,
+    agent_parser: AgentParser,
 ):
     """Test that quality checks verify score calculation."""
-    checkboxes = code_quality_checker_parser.get_section_checkboxes("Quality Checks")
-    checkboxes_text = " ".join(checkboxes).lower()
+    checkboxes_text = agent_parser.get_section_checkboxes_text("Quality Checks")
 
     assert "score" in checkboxes_text
 
@@ -199,22 +187,20 @@ def test_code_quality_checker_quality_checks_include_score(
 
 @pytest.mark.unit
 def test_code_quality_checker_warns_against_ignoring_critical(
-    code_quality_checker_parser: AgentParser,
+    agent_parser: AgentParser,
 ):
     """Test that anti-patterns warn against passing with critical violations."""
-    antipatterns = code_quality_checker_parser.extract_antipatterns()
-    antipatterns_text = " ".join(antipatterns).lower()
+    antipatterns_text = agent_parser.antipatterns_text
 
     assert "critical" in antipatterns_text or "violation" in antipatterns_text
 
 
 @pytest.mark.unit
 def test_code_quality_checker_requires_file_line_references(
-    code_quality_checker_parser: AgentParser,
+    agent_parser: AgentParser,
 ):
     """Test that anti-patterns require file:line references."""
-    antipatterns = code_quality_checker_parser.extract_antipatterns()
-    antipatterns_text = " ".join(antipatterns).lower()
+    antipatterns_text = agent_parser.antipatterns_text
 
     assert "file:line" in antipatterns_text or "traceable" in antipatterns_text
 
@@ -225,34 +211,31 @@ def test_code_quality_checker_requires_file_line_references(
 
 
 @pytest.mark.unit
-def test_code_quality_checker_output_includes_score(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_output_includes_score(agent_parser: AgentParser):
     """Test that output includes quality score."""
-    output_section = code_quality_checker_parser.get_section("Output")
+    output_section = agent_parser.get_section("Output")
 
-    assert "score" in output_section.lower()
+    assert "score" in agent_parser.get_section_lower("Output")
     assert "0-100" in output_section or "100" in output_section
 
 
 @pytest.mark.unit
-def test_code_quality_checker_output_includes_violations(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_output_includes_violations(agent_parser: AgentParser):
     """Test that output includes violations by severity."""
-    output_section = code_quality_checker_parser.get_section("Output")
+    output_tokens = agent_parser.get_section_tokens("Output")
 
-    assert "violation" in output_section.lower()
-    assert "CRITICAL" in output_section or "HIGH" in output_section
+    assert "violation" in agent_parser.get_section_lower("Output")
+    assert "CRITICAL" in output_tokens or "HIGH" in output_tokens
 
 
 @pytest.mark.unit
 def test_code_quality_checker_output_includes_tool_results(
-    code_quality_checker_parser: AgentParser,
+    agent_parser: AgentParser,
 ):
     """Test that output includes tool results."""
-    output_section = code_quality_checker_parser.get_section("Output")
-    content = output_section.lower()
+    found = find_keywords(agent_parser.get_section_lower("Output"), REPORTED_TOOLS)
 
-    assert "pylint" in content
-    assert "flake8" in content
-    assert "mypy" in content
+    assert found == REPORTED_TOOLS, f"Missing tools: {sorted(REPORTED_TOOLS - found)}"
 
 
 # ============================================================================
@@ -261,9 +244,9 @@ def test_code_quality_checker_output_includes_tool_results(
 
 
 @pytest.mark.unit
-def test_code_quality_checker_defines_score_calculation(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_defines_score_calculation(agent_parser: AgentParser):
     """Test that agent defines score calculation methodology."""
-    content = code_quality_checker_parser.content.lower()
+    content = agent_parser.content_lower
 
     assert (
         "quality score calculation" in content or "base score" in content or "deductions" in content
@@ -271,9 +254,9 @@ def test_code_quality_checker_defines_score_calculation(code_quality_checker_par
 
 
 @pytest.mark.unit
-def test_code_quality_checker_defines_pass_threshold(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_defines_pass_threshold(agent_parser: AgentParser):
     """Test that agent defines pass threshold."""
-    content = code_quality_checker_parser.content
+    content = agent_parser.content
 
     assert "≥ 80" in content or ">= 80" in content or "80" in content
 
@@ -284,9 +267,9 @@ def test_code_quality_checker_defines_pass_threshold(code_quality_checker_parser
 
 
 @pytest.mark.unit
-def test_code_quality_checker_provides_report_example(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_provides_report_example(agent_parser: AgentParser):
     """Test that agent provides example quality report."""
-    content = code_quality_checker_parser.content.lower()
+    content = agent_parser.content_lower
 
     assert "example" in content and "quality report" in content
 
@@ -297,19 +280,20 @@ def test_code_quality_checker_provides_report_example(code_quality_checker_parse
 
 
 @pytest.mark.unit
-def test_code_quality_checker_reads_implementation_files(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_reads_implementation_files(agent_parser: AgentParser):
     """Test that agent reads implementation files."""
-    files_section = code_quality_checker_parser.get_section("Files")
+    files_section = agent_parser.get_section("Files")
 
     assert "src/" in files_section or "lib/" in files_section or "services/" in files_section
 
 
 @pytest.mark.unit
-def test_code_quality_checker_excludes_tests(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_excludes_tests(agent_parser: AgentParser):
     """Test that agent excludes test files."""
-    files_section = code_quality_checker_parser.get_section("Files")
+    files_section = agent_parser.get_section("Files")
 
-    assert "Exclude:" in files_section or "exclude" in files_section.lower()
+    # "Exclude:" is covered by the lowercase check
+    assert "exclude" in agent_parser.get_section_lower("Files")
     assert "tests/" in files_section
 
 
@@ -319,11 +303,11 @@ def test_code_quality_checker_excludes_tests(code_quality_checker_parser: AgentP
 
 
 @pytest.mark.unit
-def test_code_quality_checker_enforces_rule_9(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_enforces_rule_9(agent_parser: AgentParser):
     """Test that agent enforces Rule #9 (Code Quality Standards)."""
-    content = code_quality_checker_parser.content.lower()
+    content = agent_parser.content_lower
 
-    assert "rule #9" in content or "rule 9" in content or "code quality standards" in content
+    assert 9 in agent_parser.referenced_rules or "code quality standards" in content
 
 
 # ============================================================================
@@ -332,26 +316,25 @@ def test_code_quality_checker_enforces_rule_9(code_quality_checker_parser: Agent
 
 
 @pytest.mark.unit
-def test_code_quality_checker_next_steps_mention_fixes(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_next_steps_mention_fixes(agent_parser: AgentParser):
     """Test that next steps mention fixing violations."""
-    next_steps = code_quality_checker_parser.get_section("Next Steps")
+    next_steps_lower = agent_parser.get_section_lower("Next Steps")
 
-    if next_steps:
-        next_steps_lower = next_steps.lower()
+    if next_steps_lower:
         assert "fix" in next_steps_lower
         assert "critical" in next_steps_lower or "violation" in next_steps_lower
 
 
 @pytest.mark.unit
-def test_code_quality_checker_next_steps_mention_rerun(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_next_steps_mention_rerun(agent_parser: AgentParser):
     """Test that next steps mention re-running check."""
-    next_steps = code_quality_checker_parser.get_section("Next Steps")
+    next_steps_lower = agent_parser.get_section_lower("Next Steps")
 
-    if next_steps:
+    if next_steps_lower:
         assert (
-            "re-run" in next_steps.lower()
-            or "rerun" in next_steps.lower()
-            or "verify" in next_steps.lower()
+            "re-run" in next_steps_lower
+            or "rerun" in next_steps_lower
+            or "verify" in next_steps_lower
         )
 
 
@@ -361,19 +344,16 @@ def test_code_quality_checker_next_steps_mention_rerun(code_quality_checker_pars
 
 
 @pytest.mark.unit
-def test_code_quality_checker_has_severity_levels(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_has_severity_levels(agent_parser: AgentParser):
     """Test that agent defines severity levels."""
-    content = code_quality_checker_parser.content
+    found = find_keywords(agent_parser.content, SEVERITY_LEVELS)
 
-    assert "CRITICAL" in content
-    assert "HIGH" in content
-    assert "MEDIUM" in content
-    assert "LOW" in content
+    assert found == SEVERITY_LEVELS, f"Missing severity levels: {sorted(SEVERITY_LEVELS - found)}"
 
 
 @pytest.mark.unit
-def test_code_quality_checker_mentions_spec_references(code_quality_checker_parser: AgentParser):
+def test_code_quality_checker_mentions_spec_references(agent_parser: AgentParser):
     """Test that agent checks for spec references in docstrings."""
-    content = code_quality_checker_parser.content.lower()
+    content = agent_parser.content_lower
 
     assert "spec reference" in content or "specification:" in content
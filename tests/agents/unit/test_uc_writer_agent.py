@@ -20,21 +20,80 @@ Test Coverage:
 """
 
 import pytest
-from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from tests.agents.fixtures import AgentParser
 
+# Agent under test; the shared agent_parser fixture resolves it by name
+AGENT_NAME = "uc-writer"
+
 
 # ============================================================================
-# Fixtures
+# Constants
 # ============================================================================
 
-
-@pytest.fixture
-def uc_writer_parser(agents_dir: Path) -> AgentParser:
-    """Parser for uc-writer agent."""
-    return AgentParser(agents_dir / "uc-writer.md")
+# Each check passes if the searched text contains at least one of its phrases;
+# tests that used to assert several conditions contribute one row per condition
+
+# Searched in the lowercased Responsibilities section
+RESPONSIBILITY_CHECKS = [
+    pytest.param(("interview",), id="interview-guidance"),
+    pytest.param(("16", "sixteen"), id="sixteen-sections"),
+    pytest.param(("service",), id="service-identification"),
+    pytest.param(("bdd", "acceptance criteria"), id="bdd-criteria"),
+    pytest.param(("gherkin", "given-when-then"), id="gherkin-format"),
+    pytest.param(("actor",), id="actors-identification"),
+    pytest.param(("flow",), id="flows-documentation"),
+    pytest.param(("main", "happy", "alternative"), id="flow-kinds"),
+    pytest.param(("non-functional", "performance", "security", "nfr"), id="nfr-elicitation"),
+]
+
+# Searched in the joined lowercased process steps
+PROCESS_CHECKS = [
+    pytest.param(("uc id", "uc-"), id="determines-uc-id"),
+    pytest.param(("objective",), id="objective-elicitation"),
+    pytest.param(("actor",), id="actor-identification"),
+    pytest.param(("acceptance criteria", "gherkin"), id="acceptance-criteria-generation"),
+    pytest.param(("service",), id="service-identification"),
+]
+
+# Searched in the lowercased agent file
+CHECKLIST_CHECKS = [
+    pytest.param(("checklist",), id="checklist"),
+    pytest.param(("basic information",), id="basic-information"),
+    pytest.param(("core requirements",), id="core-requirements"),
+    pytest.param(("uc id",), id="uc-id"),
+    pytest.param(("title",), id="title"),
+    pytest.param(("priority",), id="priority"),
+    pytest.param(("estimated effort",), id="estimated-effort"),
+    pytest.param(("main flow",), id="main-flow"),
+    pytest.param(("alternative flow", "alternative"), id="alternative-flow"),
+    pytest.param(("error scenario", "error"), id="error-scenario"),
+]
+
+# Searched in the lowercased Quality Checks checkboxes
+QUALITY_CHECKS = [
+    pytest.param(("uc id", "uc-"), id="uc-id"),
+    pytest.param(("service",), id="services"),
+    pytest.param(("placeholder", "["), id="reject-placeholders"),
+    pytest.param(("gherkin", "given-when-then"), id="gherkin"),
+    pytest.param(("3", "≥3", "three"), id="minimum-flow-steps"),
+]
+
+# Searched in the joined lowercased anti-patterns
+ANTIPATTERN_CHECKS = [
+    pytest.param(("vague", "generic"), id="vague-requirements"),
+    pytest.param(("service",), id="missing-services"),
+    pytest.param(("placeholder", "["), id="placeholders"),
+]
+
+# Searched in the lowercased agent file
+QUESTION_CHECKS = [
+    pytest.param(("what problem",), id="objective"),
+    pytest.param(("value",), id="user-value"),
+    pytest.param(("who initiates", "who uses"), id="actors"),
+    pytest.param(("what can go wrong",), id="errors"),
+]
 
 
 # ============================================================================
@@ -43,23 +102,23 @@ def uc_writer_parser(agents_dir: Path) -> AgentParser:
 
 
 @pytest.mark.unit
-def test_uc_writer_has_correct_metadata(uc_writer_parser: AgentParser):
+def test_uc_writer_has_correct_metadata(agent_parser: AgentParser):
     """Test that uc-writer has correct metadata configuration."""
-    assert uc_writer_parser.name == "uc-writer"
-    assert uc_writer_parser.get_metadata_field("model") == "opus"
+    assert agent_parser.name == "uc-writer"
+    assert agent_parser.get_metadata_field("model") == "opus"
 
     # Should have tools for research and file operations
-    tools = uc_writer_parser.get_metadata_field("tools")
+    tools = agent_parser.get_metadata_field("tools")
     assert "Read" in tools
     assert "Write" in tools
     assert "WebSearch" in tools  # For domain research
 
 
 @pytest.mark.unit
-def test_uc_writer_description_mentions_requirements(uc_writer_parser: AgentParser):
+def test_uc_writer_description_mentions_requirements(agent_parser: AgentParser):
     """Test that description emphasizes requirements analysis."""
-    description = uc_writer_parser.get_metadata_field("description")
-    assert "requirements" in description.lower() or "use case" in description.lower()
+    description = agent_parser.get_metadata_field("description").lower()
+    assert "requirements" in description or "use case" in description
 
 
 # ============================================================================
@@ -68,59 +127,12 @@ def test_uc_writer_description_mentions_requirements(uc_writer_parser: AgentPars
 
 
 @pytest.mark.unit
-def test_uc_writer_covers_interview_guidance(uc_writer_parser: AgentParser):
-    """Test that agent covers structured interview guidance."""
-    responsibilities = uc_writer_parser.get_section("Responsibilities")
-    assert "interview" in responsibilities.lower()
-    assert "16" in responsibilities or "sixteen" in responsibilities.lower()
-
-
-@pytest.mark.unit
-def test_uc_writer_covers_service_identification(uc_writer_parser: AgentParser):
-    """Test that agent covers service identification (Rule #1)."""
-    responsibilities = uc_writer_parser.get_section("Responsibilities")
-    assert "service" in responsibilities.lower()
-
-
-@pytest.mark.unit
-def test_uc_writer_covers_bdd_criteria(uc_writer_parser: AgentParser):
-    """Test that agent covers BDD acceptance criteria."""
-    responsibilities = uc_writer_parser.get_section("Responsibilities")
-    content = responsibilities.lower()
-
-    assert "bdd" in content or "acceptance criteria" in content
-    assert "gherkin" in content or "given-when-then" in content
-
-
-@pytest.mark.unit
-def test_uc_writer_covers_actors_identification(uc_writer_parser: AgentParser):
-    """Test that agent covers actor identification."""
-    responsibilities = uc_writer_parser.get_section("Responsibilities")
-    assert "actor" in responsibilities.lower()
-
-
-@pytest.mark.unit
-def test_uc_writer_covers_flows_documentation(uc_writer_parser: AgentParser):
-    """Test that agent covers flow documentation."""
-    responsibilities = uc_writer_parser.get_section("Responsibilities")
-    content = responsibilities.lower()
+@pytest.mark.parametrize("phrases", RESPONSIBILITY_CHECKS)
+def test_uc_writer_covers_responsibility(agent_parser: AgentParser, phrases: Tuple[str, ...]):
+    """Test that agent covers each interview and specification responsibility."""
+    responsibilities = agent_parser.get_section_lower("Responsibilities")
 
-    assert "flow" in content
-    assert "main" in content or "happy" in content or "alternative" in content
-
-
-@pytest.mark.unit
-def test_uc_writer_covers_nfr_elicitation(uc_writer_parser: AgentParser):
-    """Test that agent covers non-functional requirements."""
-    responsibilities = uc_writer_parser.get_section("Responsibilities")
-    content = responsibilities.lower()
-
-    assert (
-        "non-functional" in content
-        or "performance" in content
-        or "security" in content
-        or "nfr" in content
-    )
+    assert any(phrase in responsibilities for phrase in phrases), f"Missing any of {phrases}"
 
 
 # ============================================================================
@@ -129,48 +141,12 @@ def test_uc_writer_covers_nfr_elicitation(uc_writer_parser: AgentParser):
 
 
 @pytest.mark.unit
-def test_uc_writer_process_determines_uc_id(uc_writer_parser: AgentParser):
-    """Test that process includes determining next UC ID."""
-    process_steps = uc_writer_parser.extract_process_steps()
-    process_text = " ".join(process_steps).lower()
-
-    assert "uc id" in process_text or "uc-" in process_text
-
-
-@pytest.mark.unit
-def test_uc_writer_process_includes_objective_elicitation(uc_writer_parser: AgentParser):
-    """Test that process includes eliciting objective."""
-    process_steps = uc_writer_parser.extract_process_steps()
-    process_text = " ".join(process_steps).lower()
+@pytest.mark.parametrize("phrases", PROCESS_CHECKS)
+def test_uc_writer_process_includes(agent_parser: AgentParser, phrases: Tuple[str, ...]):
+    """Test that process steps cover UC ID, objective, actors, criteria and services."""
+    process_text = agent_parser.process_steps_text
 
-    assert "objective" in process_text
-
-
-@pytest.mark.unit
-def test_uc_writer_process_includes_actor_identification(uc_writer_parser: AgentParser):
-    """Test that process includes actor identification."""
-    process_steps = uc_writer_parser.extract_process_steps()
-    process_text = " ".join(process_steps).lower()
-
-    assert "actor" in process_text
-
-
-@pytest.mark.unit
-def test_uc_writer_process_includes_acceptance_criteria_generation(uc_writer_parser: AgentParser):
-    """Test that process includes generating acceptance criteria."""
-    process_steps = uc_writer_parser.extract_process_steps()
-    process_text = " ".join(process_steps).lower()
-
-    assert "acceptance criteria" in process_text or "gherkin" in process_text
-
-
-@pytest.mark.unit
-def test_uc_writer_process_includes_service_identification(uc_writer_parser: AgentParser):
-    """Test that process includes identifying services."""
-    process_steps = uc_writer_parser.extract_process_steps()
-    process_text = " ".join(process_steps).lower()
-
-    assert "service" in process_text
+    assert any(phrase in process_text for phrase in phrases), f"Missing any of {phrases}"
 
 
 # ============================================================================
@@ -179,35 +155,12 @@ def test_uc_writer_process_includes_service_identification(uc_writer_parser: Age
 
 
 @pytest.mark.unit
-def test_uc_writer_has_comprehensive_checklist(uc_writer_parser: AgentParser):
-    """Test that agent has comprehensive UC creation checklist."""
-    # Look for checklist section
-    content = uc_writer_parser.content.lower()
-
-    assert "checklist" in content
-    assert "basic information" in content
-    assert "core requirements" in content
-
-
-@pytest.mark.unit
-def test_uc_writer_checklist_includes_basic_info(uc_writer_parser: AgentParser):
-    """Test that checklist includes basic information items."""
-    content = uc_writer_parser.content.lower()
-
-    assert "uc id" in content
-    assert "title" in content
-    assert "priority" in content
-    assert "estimated effort" in content
-
-
-@pytest.mark.unit
-def test_uc_writer_checklist_includes_flows(uc_writer_parser: AgentParser):
-    """Test that checklist includes flow requirements."""
-    content = uc_writer_parser.content.lower()
+@pytest.mark.parametrize("phrases", CHECKLIST_CHECKS)
+def test_uc_writer_checklist_includes(agent_parser: AgentParser, phrases: Tuple[str, ...]):
+    """Test that agent has a UC creation checklist covering basic info and flows."""
+    content = agent_parser.content_lower
 
-    assert "main flow" in content
-    assert "alternative flow" in content or "alternative" in content
-    assert "error scenario" in content or "error" in content
+    assert any(phrase in content for phrase in phrases), f"Missing any of {phrases}"
 
 
 # ============================================================================
@@ -216,49 +169,12 @@ def test_uc_writer_checklist_includes_flows(uc_writer_parser: AgentParser):
 
 
 @pytest.mark.unit
-def test_uc_writer_quality_checks_include_uc_id(uc_writer_parser: AgentParser):
-    """Test that quality checks verify UC ID assignment."""
-    checkboxes = uc_writer_parser.get_section_checkboxes("Quality Checks")
-    checkboxes_text = " ".join(checkboxes).lower()
-
-    assert "uc id" in checkboxes_text or "uc-" in checkboxes_text
-
-
-@pytest.mark.unit
-def test_uc_writer_quality_checks_include_services(uc_writer_parser: AgentParser):
-    """Test that quality checks verify Services Used section."""
-    checkboxes = uc_writer_parser.get_section_checkboxes("Quality Checks")
-    checkboxes_text = " ".join(checkboxes).lower()
+@pytest.mark.parametrize("phrases", QUALITY_CHECKS)
+def test_uc_writer_quality_checks_include(agent_parser: AgentParser, phrases: Tuple[str, ...]):
+    """Test that quality checks verify UC ID, services, placeholders, Gherkin and flows."""
+    checkboxes_text = agent_parser.get_section_checkboxes_text("Quality Checks")
 
-    assert "service" in checkboxes_text
-
-
-@pytest.mark.unit
-def test_uc_writer_quality_checks_reject_placeholders(uc_writer_parser: AgentParser):
-    """Test that quality checks reject placeholder text."""
-    checkboxes = uc_writer_parser.get_section_checkboxes("Quality Checks")
-    checkboxes_text = " ".join(checkboxes).lower()
-
-    assert "placeholder" in checkboxes_text or "[" in checkboxes_text
-
-
-@pytest.mark.unit
-def test_uc_writer_quality_checks_include_gherkin(uc_writer_parser: AgentParser):
-    """Test that quality checks verify Gherkin format."""
-    checkboxes = uc_writer_parser.get_section_checkboxes("Quality Checks")
-    checkboxes_text = " ".join(checkboxes).lower()
-
-    assert "gherkin" in checkboxes_text or "given-when-then" in checkboxes_text
-
-
-@pytest.mark.unit
-def test_uc_writer_quality_checks_minimum_flow_steps(uc_writer_parser: AgentParser):
-    """Test that quality checks require minimum flow steps."""
-    checkboxes = uc_writer_parser.get_section_checkboxes("Quality Checks")
-    checkboxes_text = " ".join(checkboxes)
-
-    # Should require at least 3 steps in main flow
-    assert "3" in checkboxes_text or "≥3" in checkboxes_text or "three" in checkboxes_text.lower()
+    assert any(phrase in checkboxes_text for phrase in phrases), f"Missing any of {phrases}"
 
 
 # ============================================================================
@@ -267,37 +183,18 @@ def test_uc_writer_quality_checks_minimum_flow_steps(uc_writer_parser: AgentPars
 
 
 @pytest.mark.unit
-def test_uc_writer_warns_against_vague_requirements(uc_writer_parser: AgentParser):
-    """Test that anti-patterns warn against vague requirements."""
-    antipatterns = uc_writer_parser.extract_antipatterns()
-    antipatterns_text = " ".join(antipatterns).lower()
-
-    assert "vague" in antipatterns_text or "generic" in antipatterns_text
-
-
-@pytest.mark.unit
-def test_uc_writer_warns_against_missing_services(uc_writer_parser: AgentParser):
-    """Test that anti-patterns warn about missing Services Used section."""
-    antipatterns = uc_writer_parser.extract_antipatterns()
-    antipatterns_text = " ".join(antipatterns).lower()
-
-    assert "service" in antipatterns_text
-
-
-@pytest.mark.unit
-def test_uc_writer_warns_against_placeholders(uc_writer_parser: AgentParser):
-    """Test that anti-patterns warn about leaving placeholders."""
-    antipatterns = uc_writer_parser.extract_antipatterns()
-    antipatterns_text = " ".join(antipatterns).lower()
+@pytest.mark.parametrize("keywords", ANTIPATTERN_CHECKS)
+def test_uc_writer_warns_against(agent_parser: AgentParser, keywords: Tuple[str, ...]):
+    """Test that anti-patterns warn about vague, incomplete or placeholder specs."""
+    antipatterns_text = agent_parser.antipatterns_text
 
-    assert "placeholder" in antipatterns_text or "[" in antipatterns_text
+    assert any(keyword in antipatterns_text for keyword in keywords), f"Missing any of {keywords}"
 
 
 @pytest.mark.unit
-def test_uc_writer_warns_against_generic_acceptance_criteria(uc_writer_parser: AgentParser):
+def test_uc_writer_warns_against_generic_acceptance_criteria(agent_parser: AgentParser):
     """Test that anti-patterns warn about generic acceptance criteria."""
-    antipatterns = uc_writer_parser.extract_antipatterns()
-    antipatterns_text = " ".join(antipatterns).lower()
+    antipatterns_text = agent_parser.antipatterns_text
 
     assert (
         "generic" in antipatterns_text
@@ -312,37 +209,20 @@ def test_uc_writer_warns_against_generic_acceptance_criteria(uc_writer_parser: A
 
 
 @pytest.mark.unit
-def test_uc_writer_provides_interview_questions(uc_writer_parser: AgentParser):
+def test_uc_writer_provides_interview_questions(agent_parser: AgentParser):
     """Test that agent provides interview question library."""
-    content = uc_writer_parser.content.lower()
+    content = agent_parser.content_lower
 
     assert "interview question" in content or "question library" in content
 
 
 @pytest.mark.unit
-def test_uc_writer_questions_cover_objective(uc_writer_parser: AgentParser):
-    """Test that questions cover objective and user value."""
-    content = uc_writer_parser.content
+@pytest.mark.parametrize("phrases", QUESTION_CHECKS)
+def test_uc_writer_questions_cover(agent_parser: AgentParser, phrases: Tuple[str, ...]):
+    """Test that interview questions cover objective, value, actors and errors."""
+    content = agent_parser.content_lower
 
-    # Should have questions about problem, objective, value
-    assert "What problem" in content or "what problem" in content
-    assert "value" in content.lower()
-
-
-@pytest.mark.unit
-def test_uc_writer_questions_cover_actors(uc_writer_parser: AgentParser):
-    """Test that questions cover actors."""
-    content = uc_writer_parser.content
-
-    assert "Who initiates" in content or "who initiates" in content or "Who uses" in content
-
-
-@pytest.mark.unit
-def test_uc_writer_questions_cover_errors(uc_writer_parser: AgentParser):
-    """Test that questions cover error scenarios."""
-    content = uc_writer_parser.content
-
-    assert "What can go wrong" in content or "what can go wrong" in content
+    assert any(phrase in content for phrase in phrases), f"Missing any of {phrases}"
 
 
 # ============================================================================
@@ -351,17 +231,17 @@ def test_uc_writer_questions_cover_errors(uc_writer_parser: AgentParser):
 
 
 @pytest.mark.unit
-def test_uc_writer_provides_interview_flow_example(uc_writer_parser: AgentParser):
+def test_uc_writer_provides_interview_flow_example(agent_parser: AgentParser):
     """Test that agent provides example interview flow."""
-    content = uc_writer_parser.content.lower()
+    content = agent_parser.content_lower
 
     assert "example interview" in content or "example flow" in content
 
 
 @pytest.mark.unit
-def test_uc_writer_example_shows_complete_uc(uc_writer_parser: AgentParser):
+def test_uc_writer_example_shows_complete_uc(agent_parser: AgentParser):
     """Test that example shows complete UC structure."""
-    content = uc_writer_parser.content
+    content = agent_parser.content
 
     # Example should show UC structure
     has_uc_structure = (
@@ -380,25 +260,23 @@ def test_uc_writer_example_shows_complete_uc(uc_writer_parser: AgentParser):
 
 
 @pytest.mark.unit
-def test_uc_writer_reads_template(uc_writer_parser: AgentParser):
+def test_uc_writer_reads_template(agent_parser: AgentParser):
     """Test that agent reads UC template."""
-    files_section = uc_writer_parser.get_section("Files")
-
-    assert "use-case-template" in files_section.lower()
+    assert "use-case-template" in agent_parser.get_section_lower("Files")
 
 
 @pytest.mark.unit
-def test_uc_writer_reads_service_registry(uc_writer_parser: AgentParser):
+def test_uc_writer_reads_service_registry(agent_parser: AgentParser):
     """Test that agent reads service registry."""
-    files_section = uc_writer_parser.get_section("Files")
+    files_lower = agent_parser.get_section_lower("Files")
 
-    assert "service-registry" in files_section.lower() or "service" in files_section.lower()
+    assert "service-registry" in files_lower or "service" in files_lower
 
 
 @pytest.mark.unit
-def test_uc_writer_writes_to_specs_directory(uc_writer_parser: AgentParser):
+def test_uc_writer_writes_to_specs_directory(agent_parser: AgentParser):
     """Test that agent writes to specs/use-cases/ directory."""
-    files_section = uc_writer_parser.get_section("Files")
+    files_section = agent_parser.get_section("Files")
 
     assert "specs/use-cases" in files_section or "UC-" in files_section
 
@@ -409,17 +287,17 @@ def test_uc_writer_writes_to_specs_directory(uc_writer_parser: AgentParser):
 
 
 @pytest.mark.unit
-def test_uc_writer_enforces_rule_1(uc_writer_parser: AgentParser):
+def test_uc_writer_enforces_rule_1(agent_parser: AgentParser):
     """Test that agent enforces Rule #1 (Specifications Are Law)."""
-    content = uc_writer_parser.content.lower()
+    content = agent_parser.content_lower
 
-    assert "rule #1" in content or "rule 1" in content or "specifications are law" in content
+    assert 1 in agent_parser.referenced_rules or "specifications are law" in content
 
 
 @pytest.mark.unit
-def test_uc_writer_mentions_service_oriented_architecture(uc_writer_parser: AgentParser):
+def test_uc_writer_mentions_service_oriented_architecture(agent_parser: AgentParser):
     """Test that agent mentions service-oriented architecture."""
-    content = uc_writer_parser.content.lower()
+    content = agent_parser.content_lower
 
     assert "service-oriented" in content or "service oriented" in content
 
@@ -430,9 +308,9 @@ def test_uc_writer_mentions_service_oriented_architecture(uc_writer_parser: Agen
 
 
 @pytest.mark.unit
-def test_uc_writer_output_lists_16_sections(uc_writer_parser: AgentParser):
+def test_uc_writer_output_lists_16_sections(agent_parser: AgentParser):
     """Test that output section describes all UC sections."""
-    output_section = uc_writer_parser.get_section("Output")
+    output_section = agent_parser.get_section("Output")
 
     # Should mention key sections
     assert "Objective" in output_section
@@ -443,9 +321,9 @@ def test_uc_writer_output_lists_16_sections(uc_writer_parser: AgentParser):
 
 
 @pytest.mark.unit
-def test_uc_writer_output_requires_gherkin_scenarios(uc_writer_parser: AgentParser):
+def test_uc_writer_output_requires_gherkin_scenarios(agent_parser: AgentParser):
     """Test that output requires Gherkin scenarios."""
-    output_section = uc_writer_parser.get_section("Output")
+    output_section = agent_parser.get_section("Output")
 
     assert "Gherkin" in output_section or "Given-When-Then" in output_section
 
@@ -456,21 +334,21 @@ def test_uc_writer_output_requires_gherkin_scenarios(uc_writer_parser: AgentPars
 
 
 @pytest.mark.unit
-def test_uc_writer_next_steps_mention_bdd_scenario_writer(uc_writer_parser: AgentParser):
+def test_uc_writer_next_steps_mention_bdd_scenario_writer(agent_parser: AgentParser):
     """Test that next steps mention bdd-scenario-writer agent."""
-    next_steps = uc_writer_parser.get_section("Next Steps")
+    next_steps_lower = agent_parser.get_section_lower("Next Steps")
 
-    if next_steps:
-        assert "bdd-scenario-writer" in next_steps.lower()
+    if next_steps_lower:
+        assert "bdd-scenario-writer" in next_steps_lower
 
 
 @pytest.mark.unit
-def test_uc_writer_next_steps_mention_test_writer(uc_writer_parser: AgentParser):
+def test_uc_writer_next_steps_mention_test_writer(agent_parser: AgentParser):
     """Test that next steps mention test-writer agent."""
-    next_steps = uc_writer_parser.get_section("Next Steps")
+    next_steps_lower = agent_parser.get_section_lower("Next Steps")
 
-    if next_steps:
-        assert "test-writer" in next_steps.lower()
+    if next_steps_lower:
+        assert "test-writer" in next_steps_lower
 
 
 # ============================================================================
@@ -479,9 +357,9 @@ def test_uc_writer_next_steps_mention_test_writer(uc_writer_parser: AgentParser)
 
 
 @pytest.mark.unit
-def test_uc_writer_has_comprehensive_process(uc_writer_parser: AgentParser):
+def test_uc_writer_has_comprehensive_process(agent_parser: AgentParser):
     """Test that process is comprehensive (16+ steps for 16 sections)."""
-    process_steps = uc_writer_parser.extract_process_steps()
+    process_steps = agent_parser.extract_process_steps()
 
     assert len(process_steps) >= 15, (
         f"uc-writer should have ≥15 process steps for 16-section interview, "
@@ -490,17 +368,17 @@ def test_uc_writer_has_comprehensive_process(uc_writer_parser: AgentParser):
 
 
 @pytest.mark.unit
-def test_uc_writer_mentions_data_requirements(uc_writer_parser: AgentParser):
+def test_uc_writer_mentions_data_requirements(agent_parser: AgentParser):
     """Test that agent covers data requirements section."""
-    content = uc_writer_parser.content.lower()
+    content = agent_parser.content_lower
 
     assert "data requirement" in content or "input data" in content
     assert "validation" in content
 
 
 @pytest.mark.unit
-def test_uc_writer_mentions_implementation_plan(uc_writer_parser: AgentParser):
+def test_uc_writer_mentions_implementation_plan(agent_parser: AgentParser):
     """Test that agent covers implementation planning."""
-    content = uc_writer_parser.content.lower()
+    content = agent_parser.content_lower
 
     assert "implementation plan" in content or "iteration" in content
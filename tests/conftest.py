@@ -6,11 +6,18 @@ This module provides:
 - Test utilities and helpers
 """
 
+import os
 import pytest
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 
 # ============================================================================
 # Path Configuration
@@ -48,13 +55,21 @@ def templates_dir() -> Path:
 @pytest.fixture(scope="session")
 def all_agent_files() -> List[Path]:
     """Return list of all agent markdown files."""
-    return list(AGENTS_DIR.glob("*.md"))
+    try:
+        with os.scandir(AGENTS_DIR) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".md") and not entry.name.startswith(".") and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
 
 
 @pytest.fixture(scope="session")
-def agent_names() -> List[str]:
+def agent_names(all_agent_files: List[Path]) -> List[str]:
     """Return list of all agent names (without .md extension)."""
-    return [f.stem for f in AGENTS_DIR.glob("*.md")]
+    return [f.stem for f in all_agent_files]
 
 
 @pytest.fixture
@@ -74,9 +89,13 @@ def agent_file(request) -> Path:
 # ============================================================================
 
 
+@lru_cache(maxsize=None)
 def parse_agent_file(agent_path: Path) -> Dict[str, Any]:
     """Parse agent markdown file into structured data.
 
+    Results are cached per path for the whole run, so callers share one
+    dictionary per agent file and must not mutate it.
+
     Args:
         agent_path: Path to agent markdown file
 
@@ -97,7 +116,7 @@ def parse_agent_file(agent_path: Path) -> Dict[str, Any]:
 
     # Parse YAML front matter
     try:
-        metadata = yaml.safe_load(parts[1])
+        metadata = yaml.load(parts[1], Loader=SafeLoader)
     except yaml.YAMLError:
         metadata = {}
 
@@ -159,7 +178,7 @@ def mock_fs(tmp_path: Path) -> Path:
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_uc_content() -> str:
     """Return sample use case content for testing."""
     return """---
@@ -219,7 +238,7 @@ Feature: User Registration
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_service_spec() -> str:
     """Return sample service specification for testing."""
     return """# UserService Specification
@@ -8,6 +8,18 @@ from typing import Dict, List, Any, Optional, Set
 import re
 import yaml
 
+# libyaml's C loader is several times faster; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
+# Compiled once at import instead of per call through the re module cache
+PLACEHOLDER_PATTERN = re.compile(r"\[([A-Z_][A-Z0-9_]*)\]")
+LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^\)]+)\)")
+H1_PATTERN = re.compile(r"^# (.+)", re.MULTILINE)
+
 
 def get_all_template_paths() -> List[Path]:
     """Get paths to all template markdown files.
@@ -60,7 +72,7 @@ class TemplateParser:
             return {}, self._content
 
         try:
-            metadata = yaml.safe_load(parts[1])
+            metadata = yaml.load(parts[1], Loader=SafeLoader)
         except yaml.YAMLError:
             metadata = {}
 
@@ -147,8 +159,7 @@ class TemplateParser:
         Returns:
             List of placeholder names (without brackets)
         """
-        placeholder_pattern = r"\[([A-Z_][A-Z0-9_]*)\]"
-        matches = re.findall(placeholder_pattern, self._body)
+        matches = PLACEHOLDER_PATTERN.findall(self._body)
         return sorted(set(matches))
 
     def extract_placeholder_locations(self) -> Dict[str, List[int]]:
@@ -157,11 +168,10 @@ class TemplateParser:
         Returns:
             Dict mapping placeholder names to list of line numbers
         """
-        placeholder_pattern = r"\[([A-Z_][A-Z0-9_]*)\]"
         locations = {}
 
         for line_num, line in enumerate(self._body.split("\n"), 1):
-            matches = re.findall(placeholder_pattern, line)
+            matches = PLACEHOLDER_PATTERN.findall(line)
             for match in matches:
                 if match not in locations:
                     locations[match] = []
@@ -240,8 +250,7 @@ class TemplateParser:
         Returns:
             List of (link_text, link_url) tuples
         """
-        link_pattern = r"\[([^\]]+)\]\(([^\)]+)\)"
-        matches = re.findall(link_pattern, self._body)
+        matches = LINK_PATTERN.findall(self._body)
         return matches
 
     def extract_file_references(self) -> List[str]:
@@ -289,8 +298,7 @@ class TemplateParser:
 
     def has_h1_title(self) -> bool:
         """Check if template has exactly one H1 title."""
-        h1_pattern = r"^# .+"
-        matches = re.findall(h1_pattern, self._body, re.MULTILINE)
+        matches = H1_PATTERN.findall(self._body)
         return len(matches) == 1
 
     def get_h1_title(self) -> Optional[str]:
@@ -299,8 +307,7 @@ class TemplateParser:
         Returns:
             Title text without the # marker, or None if no H1 found
         """
-        h1_pattern = r"^# (.+)"
-        match = re.search(h1_pattern, self._body, re.MULTILINE)
+        match = H1_PATTERN.search(self._body)
         return match.group(1).strip() if match else None
 
     # ========================================================================